@@ -3,34 +3,55 @@
 Modern PDF to DOCX Converter
 
 A completely rewritten converter using:
-- pypdf for proper text and image extraction (no text-to-image conversion)
+- PyMuPDF for proper text and image extraction (no text-to-image conversion)
 - python-docx for proper DOCX creation with template support
 - Proper spacing, layout, and formatting preservation
 """
 
+import os
 import sys
 import logging
 import re
-from collections.abc import Sequence, Mapping, Callable
+import threading
+from collections import deque
+from collections.abc import Sequence, Mapping, Callable, Iterable, Iterator
 from typing import Any, TypeVar, ParamSpec, Optional, Union
 from pathlib import Path
 from io import BytesIO
 from dataclasses import dataclass
+from functools import partial
+from itertools import chain, islice
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
+from xml.sax.saxutils import escape, quoteattr
 
 # Core libraries
 try:
     import fitz  # PyMuPDF
+    import numpy as np
     from docx import Document
-    from docx.shared import Inches, Pt, RGBColor
-    from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
+    from docx.shared import Inches, RGBColor
     from docx.enum.section import WD_ORIENT, WD_SECTION
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
     from docx.oxml.shared import OxmlElement, qn
-    from PIL import Image
+    from docx.oxml.shape import CT_Inline
+    from docx.image import SIGNATURES as DOCX_IMAGE_SIGNATURES
+    from docx.opc.pkgwriter import PackageWriter
+    from docx.opc.phys_pkg import _ZipPkgWriter
 except ImportError as e:
     print(f"Missing required library: {e}")
-    print("Install with: pip install PyMuPDF python-docx pillow")
+    print("Install with: pip install PyMuPDF python-docx numpy")
     sys.exit(1)
 
+# Optional JIT for the line-grouping kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
 logger = logging.getLogger(__name__)
@@ -45,6 +66,100 @@ ConversionResult = dict[str, Any]
 T = TypeVar('T')
 P = ParamSpec('P')
 
+# Span-level text extraction flags: no image blocks and no text outside the
+# page's mediabox
+TEXT_EXTRACTION_FLAGS = (
+    fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+)
+
+# PDF user space units (and image pixels, assuming 72 DPI) per inch
+POINTS_PER_INCH = 72
+
+# Default cap on extraction processes; MuPDF scaling flattens out beyond this
+MAX_EXTRACT_WORKERS = 4
+
+# Below this many pages, pool start-up costs more than it saves
+MIN_PARALLEL_PAGES = 3
+
+# Pages per task sent to an extraction worker: small enough that only a few
+# finished pages wait in memory, large enough to amortize re-opening the PDF
+PAGES_PER_TASK = 4
+
+# Share of MuPDF's resource store freed after each extracted page
+STORE_SHRINK_PERCENT = 50
+
+# Opening tag and properties shared by every text paragraph:
+# single line spacing, 0pt before, 6pt after
+PARAGRAPH_OPEN_XML = (
+    f'<w:p {nsdecls("w")}><w:pPr>'
+    '<w:spacing w:line="240" w:lineRule="auto" w:before="0" w:after="120"/>'
+    '</w:pPr>'
+)
+
+# Centered paragraph with one empty run, which receives an image's drawing
+IMAGE_PARAGRAPH_XML = (
+    f'<w:p {nsdecls("w")}><w:pPr><w:jc w:val="center"/></w:pPr><w:r/></w:p>'
+)
+
+# Paragraph holding a single page break, as written by Document.add_page_break()
+PAGE_BREAK_XML = f'<w:p {nsdecls("w")}><w:r><w:br w:type="page"/></w:r></w:p>'
+
+# Run property fragments for the four bold/italic combinations, indexed by
+# ((flags >> 3) & 2) | ((flags >> 1) & 1) from MuPDF span flags
+# (bit 1 = italic, bit 4 = bold)
+BI_LUT = ('', '<w:i/>', '<w:b/>', '<w:b/><w:i/>')
+
+# Control characters that are not allowed in XML text
+_XML_INVALID_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# Spacing repairs applied by _fix_text_spacing in a single pass: insertion
+# points between a lowercase letter and an uppercase letter or digit, and
+# between sentence punctuation and a capital, plus whitespace runs that are
+# not already a single space. Every match is replaced with one space. The
+# lookaheads come first so most positions fail on one character test.
+_RE_FIX_SPACING = re.compile(
+    r'\s{2,}|[^\S ]|(?=[A-Z])(?<=[a-z.!?])|(?=\d)(?<=[a-z])'
+)
+
+# Anything _RE_FIX_SPACING could act on in text without uppercase letters
+_RE_FIX_SPACING_TRIGGER = re.compile(r'[^\S ]| {2}|\d')
+
+# Font name cleanup: subset tag ("ABCDEF+") and style/variant suffixes
+_RE_FONT_SUBSET_PREFIX = re.compile(r'^[A-Z]+\+')
+_RE_FONT_VARIANT = re.compile(r'[,\-].*$')
+
+# Common PDF fonts mapped to Word fonts, as (lowercase needle, Word font)
+FONT_MAPPING = (
+    ('times', 'Times New Roman'),
+    ('helvetica', 'Arial'),
+    ('courier', 'Courier New'),
+    ('symbol', 'Symbol'),
+    ('zapfdingbats', 'Wingdings'),
+)
+
+# zlib level for the saved DOCX parts
+DOCX_COMPRESS_LEVEL = 1
+
+# Image part extensions whose data is already compressed; stored as-is
+STORED_MEDIA_EXTENSIONS = frozenset({'jpeg', 'jpg', 'png', 'gif'})
+
+class _FastZipPkgWriter(_ZipPkgWriter):
+    """python-docx package writer that deflates at DOCX_COMPRESS_LEVEL and
+    stores already-compressed images without deflating them again"""
+
+    def __new__(cls, pkg_file):
+        # Bypass the PhysPkgWriter factory, which always builds a _ZipPkgWriter
+        return object.__new__(cls)
+
+    def __init__(self, pkg_file):
+        self._zipf = ZipFile(pkg_file, "w", compression=ZIP_DEFLATED, compresslevel=DOCX_COMPRESS_LEVEL)
+
+    def write(self, pack_uri, blob):
+        if pack_uri.ext.lower() in STORED_MEDIA_EXTENSIONS:
+            self._zipf.writestr(pack_uri.membername, blob, compress_type=ZIP_STORED)
+        else:
+            self._zipf.writestr(pack_uri.membername, blob)
+
 @dataclass
 class FontInfo:
     name: str
@@ -73,6 +188,25 @@ class ModernPDF2DOCXConverter:
         self.docx_document: Optional[Document] = None
         self.template_document: Optional[Document] = None
         self.custom_fonts: list[FontInfo] = []
+        # Flowing text only: one default-styled paragraph per MuPDF text block
+        self.plain_text: bool = False
+        # Lowercased custom font name -> font, in registration order
+        self._custom_font_index: dict[str, FontInfo] = {}
+        # PDF font name -> resolved DOCX font name
+        self._font_resolve_cache: dict[str, str] = {}
+        # (font name, size, flags, color) -> run properties XML
+        self._rpr_cache: dict[tuple[str, float, int, int], str] = {}
+        # Page area inside the margins, computed once the page setup is applied
+        self._image_box_inches: Optional[tuple[float, float]] = None
+        # Image xref -> (relationship id, filename, width, height) of its
+        # part in the DOCX, sized to fit the page
+        self._image_refs: dict[int, tuple[str, str, Inches, Inches]] = {}
+        # Id for the next drawing (wp:docPr) added to the document
+        self._next_shape_id = 1
+        # Body elements waiting to be written ahead of the trailing sectPr
+        self._pending_body_elements: list[Any] = []
+        # Processed image data keyed by xref, shared across pages of one PDF
+        self._image_cache: dict[int, ImageData] = {}
         self.conversion_stats: dict[str, int] = {
             'pages_processed': 0,
             'text_blocks_extracted': 0,
@@ -100,11 +234,17 @@ class ModernPDF2DOCXConverter:
         for font_path in font_paths:
             if Path(font_path).exists():
                 font_name = Path(font_path).stem
-                self.custom_fonts.append(FontInfo(
+                font_info = FontInfo(
                     name=font_name,
                     path=font_path
-                ))
+                )
+                self.custom_fonts.append(font_info)
+                self._custom_font_index.setdefault(font_name.lower(), font_info)
                 logger.info(f"Registered font: {font_name}")
+
+        # New custom fonts can change how PDF font names resolve
+        self._font_resolve_cache.clear()
+        self._rpr_cache.clear()
     
     def extract_pdf_content(
         self, 
@@ -112,11 +252,29 @@ class ModernPDF2DOCXConverter:
         password: Optional[str] = None, 
         start_page: int = 0, 
         end_page: Optional[int] = None, 
-        pages: Optional[list[int]] = None
+        pages: Optional[list[int]] = None,
+        workers: Optional[int] = None,
+        pdf_document: Optional[fitz.Document] = None
     ) -> ExtractedContent:
-        """Extract text and images from PDF using PyMuPDF"""
+        """Extract text and images from PDF using PyMuPDF
+
+        Pages are spread over ``workers`` processes (default: one per CPU,
+        at most MAX_EXTRACT_WORKERS); ``workers=1`` extracts serially in
+        this process.
+
+        ``pages`` in the result is an iterator that extracts pages as they
+        are consumed. Serially only one page's content is held at a time; in
+        parallel, at most ``2 * workers`` runs of PAGES_PER_TASK pages are
+        extracted ahead of the consumer. The PDF stays open until the iterator is exhausted, unless an already open
+        ``pdf_document`` is passed in, in which case the caller closes it.
+        """
+        owns_document = pdf_document is None
+        self.pdf_document = None
         try:
-            self.pdf_document = fitz.open(pdf_path)
+            if owns_document:
+                pdf_document = fitz.open(pdf_path, filetype="pdf")
+            self.pdf_document = pdf_document
+            self._image_cache.clear()  # xrefs are only unique within one PDF
             
             # Handle password protection
             if self.pdf_document.needs_pass:
@@ -138,32 +296,72 @@ class ModernPDF2DOCXConverter:
                 end = min(total_pages, end_page) if end_page else total_pages
                 page_indices = list(range(start, end))
             
+            if not workers:
+                workers = min(os.cpu_count() or 1, MAX_EXTRACT_WORKERS)
+
             extracted_content: ExtractedContent = {
-                'pages': [],
+                'pages': self._iter_page_content(
+                    pdf_path, password, page_indices, workers, owns_document
+                ),
                 'total_pages': len(page_indices),
                 'page_indices': page_indices
             }
-            
-            # Extract content from each page
-            for page_idx in page_indices:
-                page = self.pdf_document[page_idx]
-                page_content = self._extract_page_content(page, page_idx)
-                extracted_content['pages'].append(page_content)
-                self.conversion_stats['pages_processed'] += 1
-            
-            logger.info(f"Extracted content from {len(page_indices)} pages")
             return extracted_content
             
         except Exception as e:
             logger.error(f"Failed to extract PDF content: {e}")
+            if owns_document and self.pdf_document is not None:
+                self.pdf_document.close()
             return {}
+
+    def _iter_page_content(
+        self,
+        pdf_path: str,
+        password: Optional[str],
+        page_indices: list[int],
+        workers: int,
+        close_document: bool = True
+    ) -> Iterator[PageContent]:
+        """Yield the content of each page in order, optionally closing the PDF when done"""
+        try:
+            if workers > 1 and len(page_indices) >= MIN_PARALLEL_PAGES:
+                # Workers re-open the PDF and extract short runs of pages
+                for page_content in self._extract_pages_parallel(
+                    pdf_path, password, page_indices, workers, self.plain_text
+                ):
+                    self.conversion_stats['pages_processed'] += 1
+                    yield page_content
+            else:
+                # Extract content from each page
+                for page_idx in page_indices:
+                    page = self.pdf_document[page_idx]
+                    page_content = self._extract_page_content(page, page_idx)
+                    self.conversion_stats['pages_processed'] += 1
+                    yield page_content
+            
+            logger.info(f"Extracted content from {len(page_indices)} pages")
         finally:
-            if hasattr(self, 'pdf_document'):
+            if close_document:
                 self.pdf_document.close()
     
+    @staticmethod
+    def _extract_pages_parallel(
+        pdf_path: str,
+        password: Optional[str],
+        page_indices: list[int],
+        workers: int,
+        plain_text: bool = False
+    ) -> Iterator[PageContent]:
+        """Extract pages in worker processes, yielding them in page order"""
+        return iter_pages_in_pool(
+            partial(_extract_page_range, pdf_path, password, plain_text=plain_text),
+            page_indices,
+            workers
+        )
+
     def _extract_page_content(self, page: PDFPage, page_idx: int) -> PageContent:
         """Extract text and images from a single PDF page"""
-        return PageContent(
+        page_content = PageContent(
             page_number=page_idx,
             text_blocks=self._extract_text_with_layout(page),
             images=self._extract_images_from_page(page, page_idx),
@@ -172,45 +370,44 @@ class ModernPDF2DOCXConverter:
                 'height': float(page.mediabox.height)
             }
         )
+
+        # MuPDF's resource store is unbounded by default; evict the least
+        # recently used half after every page so long PDFs don't grow RSS
+        fitz.TOOLS.store_shrink(STORE_SHRINK_PERCENT)
+
+        return page_content
     
     def _extract_text_with_layout(self, page: PDFPage) -> list[TextBlock]:
         """Extract text with layout information using PyMuPDF with proper spacing"""
         text_blocks: list[TextBlock] = []
-        
+
         try:
-            blocks = page.get_text("blocks")
-            page_text_parts: list[TextBlock] = []
-            
-            for block in blocks:
-                if len(block) >= 5 and block[4].strip():  # Text block
-                    text = block[4].strip()
-                    bbox = block[:4]  # x0, y0, x1, y1
-                    
-                    page_text_parts.append({
-                        'text': text,
-                        'x': bbox[0],
-                        'y': bbox[1],
-                        'bbox': bbox
-                    })
-            
-            # Sort by position (top to bottom, left to right)
-            # In PDF coordinates, Y increases downward, so we sort by Y ascending
-            page_text_parts.sort(key=lambda p: (p['y'], p['x']))
-            
-            # Combine text parts with proper spacing
-            if page_text_parts:
-                combined_text = ' '.join(part['text'] for part in page_text_parts)
-                
-                text_blocks.append({
-                    'text': combined_text.strip(),
-                    'x': page_text_parts[0]['x'],
-                    'y': page_text_parts[0]['y'],
-                    'font_name': 'Unknown',
-                    'font_size': 12.0,
-                    'matrix': [1, 0, 0, 1, 0, 0],
-                    'parts': page_text_parts
-                })
-            
+            if self.plain_text:
+                return self._extract_plain_text(page)
+
+            # Images come from get_images(), so leave TEXT_PRESERVE_IMAGES off
+            # and let MuPDF skip decoding image blocks entirely
+            blocks = page.get_text("dict", flags=TEXT_EXTRACTION_FLAGS)["blocks"]
+
+            # One text block per non-empty span, carrying the real font data.
+            # MuPDF hands back a fresh font-name string per span; interning
+            # keeps one copy per font and makes the style-cache lookups cheap.
+            text_blocks = [
+                {
+                    'text': span['text'],
+                    'x': span['bbox'][0],
+                    'y': span['bbox'][1],
+                    'bbox': span['bbox'],
+                    'font_name': sys.intern(span['font']),
+                    'font_size': span['size'],
+                    'flags': span['flags'],
+                    'color': span['color']
+                }
+                for block in blocks if "lines" in block
+                for line in block["lines"]
+                for span in line["spans"] if span["text"].strip()
+            ]
+
         except Exception as e:
             logger.warning(f"PyMuPDF text extraction failed: {e}")
             # Fallback to simple extraction
@@ -222,49 +419,74 @@ class ModernPDF2DOCXConverter:
                         'x': 0,
                         'y': 0,
                         'font_name': 'Unknown',
-                        'font_size': 12.0,
-                        'matrix': [1, 0, 0, 1, 0, 0]
+                        'font_size': 12.0
                     })
             except Exception as e2:
                 logger.error(f"Fallback text extraction also failed: {e2}")
         
         return text_blocks
     
+    def _extract_plain_text(self, page: PDFPage) -> list[TextBlock]:
+        """Extract one text block per MuPDF block, without span formatting"""
+        # Block tuples are (x0, y0, x1, y1, text, block_no, block_type)
+        return [
+            {
+                'text': ' '.join(block[4].split()),  # Lines flow into one paragraph
+                'x': block[0],
+                'y': block[1],
+                'font_name': 'Calibri',
+                'font_size': 12.0
+            }
+            for block in page.get_text("blocks", flags=TEXT_EXTRACTION_FLAGS)
+            if block[6] == 0 and block[4].strip()
+        ]
+
     def _extract_images_from_page(self, page: PDFPage, page_idx: int) -> list[ImageData]:
         """Extract images from a PDF page using PyMuPDF"""
         images: list[ImageData] = []
         
         try:
-            image_list = page.get_images()
+            # Page-level images only; full=True would also walk Form XObjects.
+            # Each entry is (xref, smask, width, height, bpc, colorspace, ...)
+            image_list = page.get_images(full=False)
             
             for img_idx, img in enumerate(image_list):
                 try:
-                    # Get image reference
-                    xref = img[0]
-                    
-                    # Extract image data
-                    base_image = self.pdf_document.extract_image(xref)
-                    image_data = base_image["image"]
-                    image_ext = base_image["ext"]
+                    # Get image reference and pixel size from the image dictionary
+                    xref, _, width, height = img[:4]
                     
+                    # Repeated images (logos, headers) are processed only once
+                    cached = self._image_cache.get(xref)
+                    if cached is None:
+                        base_image = self.pdf_document.extract_image(xref)
+                        image_data = base_image["image"]
+                        image_ext = base_image["ext"]
+
+                        # Embed the original encoded bytes; only re-encode formats
+                        # python-docx cannot read (JPX, JBIG2, headerless JPEG, ...)
+                        if not is_docx_image(image_data):
+                            image_data = reencode_as_png(self.pdf_document, xref)
+                            image_ext = 'png'
+
+                        # Dimensions come from the PDF, so no need to decode the image
+                        cached = self._image_cache[xref] = {
+                            'data': image_data,
+                            'ext': image_ext,
+                            'width': width or 100,  # Default size
+                            'height': height or 100
+                        }
+                    image_ext = cached['ext']
+
                     # Create image name
                     image_name = f"image_{page_idx}_{img_idx}.{image_ext}"
-                    
-                    # Try to get image dimensions
-                    try:
-                        with Image.open(BytesIO(image_data)) as pil_image:
-                            width, height = pil_image.size
-                            format_type = pil_image.format
-                    except Exception:
-                        width, height = 100, 100  # Default size
-                        format_type = image_ext.upper()
-                    
+
                     images.append({
                         'name': image_name,
-                        'data': image_data,
-                        'width': width,
-                        'height': height,
-                        'format': format_type,
+                        'xref': xref,
+                        'data': cached['data'],
+                        'width': cached['width'],
+                        'height': cached['height'],
+                        'format': image_ext.upper(),
                         'page_number': page_idx,
                         'index': img_idx
                     })
@@ -276,7 +498,7 @@ class ModernPDF2DOCXConverter:
             logger.warning(f"Failed to extract images from page {page_idx}: {e}")
         
         return images
-    
+
     def create_docx_document(
         self, 
         extracted_content: ExtractedContent, 
@@ -286,34 +508,59 @@ class ModernPDF2DOCXConverter:
         
         # Load template or create new document
         if template_path and self.load_template(template_path):
-            # Create new document based on template
-            self.docx_document = Document(template_path)
-            # Clear existing content but keep styles and formatting
-            for paragraph in self.docx_document.paragraphs[:]:
-                p = paragraph._element
-                p.getparent().remove(p)
+            # Build on the template just loaded rather than parsing it again
+            self.docx_document = self.template_document
+            # Clear existing paragraphs but keep styles, tables and formatting,
+            # detaching them straight from the body without Paragraph proxies
+            body = self.docx_document.element.body
+            for p in body.findall(qn('w:p')):
+                body.remove(p)
         else:
             # Create new document
             self.docx_document = Document()
         
+        # Pages may be a lazy iterator; take the first page to size the document
+        pages = iter(extracted_content['pages'])
+        first_page = next(pages, None)
+
         # Apply template formatting if available
-        self._apply_template_formatting(extracted_content)
+        self._apply_template_formatting(first_page)
+        if first_page is not None:
+            self.add_pages_to_document(chain((first_page,), pages))
+        return self.docx_document
+
+    def add_pages_to_document(self, pages: Iterable[PageContent]) -> None:
+        """Append pages to ``docx_document``, with page breaks between them
+
+        The body elements are queued and written in one go at the end; each
+        PDF image (by xref) is embedded and sized once.
+        """
+        self._image_box_inches = self._get_image_box_inches()
+        self._pending_body_elements = []
+        self._image_refs = {}
+        # part.next_id rescans the whole tree and can't see queued elements,
+        # so take it once and number the drawings from there
+        self._next_shape_id = self.docx_document.part.next_id
         
-        # Process each page
-        for page_content in extracted_content['pages']:
+        # Look one page ahead so the last page gets no trailing break
+        pages = iter(pages)
+        page_content = next(pages, None)
+        while page_content is not None:
             self._process_page_content(page_content)
             
             # Add page break between pages (except for the last page)
-            if page_content != extracted_content['pages'][-1]:
-                self.docx_document.add_page_break()
+            next_page = next(pages, None)
+            if next_page is not None:
+                self._append_body_element(parse_xml(PAGE_BREAK_XML))
+            page_content = next_page
         
-        return self.docx_document
+        self._flush_body_elements()
     
-    def _apply_template_formatting(self, extracted_content: ExtractedContent) -> None:
+    def _apply_template_formatting(self, first_page: Optional[PageContent]) -> None:
         """Apply template formatting to the document"""
         if not self.template_document:
             # Set default formatting for new documents
-            self._set_default_formatting(extracted_content)
+            self._set_default_formatting(first_page)
             return
         
         # Copy template formatting
@@ -337,24 +584,23 @@ class ModernPDF2DOCXConverter:
             
         except Exception as e:
             logger.warning(f"Failed to apply template formatting: {e}")
-            self._set_default_formatting(extracted_content)
+            self._set_default_formatting(first_page)
     
-    def _set_default_formatting(self, extracted_content: ExtractedContent) -> None:
+    def _set_default_formatting(self, first_page: Optional[PageContent]) -> None:
         """Set default formatting based on PDF page size"""
         try:
-            if not self.docx_document or not extracted_content['pages']:
+            if not self.docx_document or first_page is None:
                 return
                 
             section = self.docx_document.sections[0]
             
             # Get PDF page dimensions (use first page)
-            page_content = extracted_content['pages'][0]
-            pdf_width = page_content.page_size['width']
-            pdf_height = page_content.page_size['height']
+            pdf_width = first_page.page_size['width']
+            pdf_height = first_page.page_size['height']
             
             # Convert PDF points to inches (72 points = 1 inch)
-            page_width_inches = pdf_width / 72
-            page_height_inches = pdf_height / 72
+            page_width_inches = pdf_width / POINTS_PER_INCH
+            page_height_inches = pdf_height / POINTS_PER_INCH
             
             # Set page size
             section.page_width = Inches(page_width_inches)
@@ -394,35 +640,45 @@ class ModernPDF2DOCXConverter:
         """Group text blocks into logical paragraphs"""
         if not text_blocks:
             return []
-        
-        paragraphs: list[ParagraphData] = []
-        current_paragraph = ParagraphData(text_parts=[])
+
+        # Plain text blocks are already whole paragraphs in reading order
+        if self.plain_text:
+            return [ParagraphData(text_parts=[block], y_position=block['y']) for block in text_blocks]
         
         # Group text blocks by approximate Y position
         y_threshold = 5  # Points threshold for same line
-        
-        for block in text_blocks:
-            if current_paragraph.y_position is None:
-                # First block
-                current_paragraph.y_position = block['y']
-                current_paragraph.text_parts.append(block)
-            elif abs(block['y'] - current_paragraph.y_position) <= y_threshold:
-                # Same line
-                current_paragraph.text_parts.append(block)
-            else:
-                # New line/paragraph
-                if current_paragraph.text_parts:
-                    paragraphs.append(current_paragraph)
-                
-                current_paragraph = ParagraphData(
-                    text_parts=[block],
-                    y_position=block['y']
-                )
-        
-        # Add the last paragraph
-        if current_paragraph.text_parts:
-            paragraphs.append(current_paragraph)
-        
+
+        count = len(text_blocks)
+        ys = np.fromiter((block['y'] for block in text_blocks), dtype=np.float64, count=count)
+        xs = np.fromiter((block['x'] for block in text_blocks), dtype=np.float64, count=count)
+
+        # Split the top-to-bottom order wherever the gap exceeds the threshold.
+        # A block belongs to the line of the line's first block, so this only
+        # holds when no line drifts further than the threshold; otherwise
+        # assign lines one block at a time
+        by_y = np.argsort(ys, kind='stable')
+        sorted_ys = ys[by_y]
+        is_line_start = np.empty(count, dtype=bool)
+        is_line_start[0] = True
+        np.greater(np.diff(sorted_ys), y_threshold, out=is_line_start[1:])
+        line_starts = np.flatnonzero(is_line_start)
+        line_ends = np.append(line_starts[1:], count) - 1
+
+        if np.all(sorted_ys[line_ends] - sorted_ys[line_starts] <= y_threshold):
+            line_ids = np.empty(count, dtype=np.int64)
+            line_ids[by_y] = np.cumsum(is_line_start) - 1
+        else:
+            line_ids = _assign_line_ids(ys, by_y, y_threshold)
+
+        # Order by line, then left to right within each line
+        order = np.lexsort((xs, line_ids))
+        line_breaks = np.flatnonzero(np.diff(line_ids[order])) + 1
+
+        paragraphs: list[ParagraphData] = [
+            ParagraphData(text_parts=[text_blocks[idx] for idx in line], y_position=ys[line[0]])
+            for line in np.split(order, line_breaks)
+        ]
+
         return paragraphs
     
     def _add_paragraph_to_document(self, paragraph_data: ParagraphData) -> None:
@@ -435,101 +691,129 @@ class ModernPDF2DOCXConverter:
         
         if not self.docx_document:
             return
-            
-        # Create paragraph
-        paragraph = self.docx_document.add_paragraph()
-        
-        # Add text runs with formatting
+
+        # Build the whole paragraph as one XML string and parse it once,
+        # bypassing python-docx's per-run property setters. Consecutive spans
+        # that end up with the same run properties share a single run.
+        runs: list[tuple[str, list[str]]] = []
+        prev_part: Optional[TextBlock] = None
         for text_part in paragraph_data.text_parts:
-            run = paragraph.add_run(text_part['text'])
-            self._apply_font_formatting(run, text_part)  # Apply font formatting
-        
-        # Apply paragraph formatting
-        self._apply_paragraph_formatting(paragraph, paragraph_data)
+            text = text_part['text']
+
+            # Spans from separate PDF lines may sit side by side without a space
+            if (prev_part is not None and 'bbox' in prev_part
+                    and text_part['x'] - prev_part['bbox'][2] > 1
+                    and not prev_part['text'][-1:].isspace() and not text[:1].isspace()):
+                text = ' ' + text
+
+            rpr_xml = self._get_run_properties_xml(text_part)
+            if runs and runs[-1][0] == rpr_xml:
+                runs[-1][1].append(text)
+            else:
+                runs.append((rpr_xml, [text]))
+            prev_part = text_part
+
+        run_xml = ''.join(self._build_run_xml(''.join(texts), rpr_xml) for rpr_xml, texts in runs)
+        paragraph = parse_xml(f"{PARAGRAPH_OPEN_XML}{run_xml}</w:p>")
+        self._append_body_element(paragraph)
     
     def _combine_text_with_spacing(self, text_parts: list[TextBlock]) -> str:
         """Combine text parts with proper spacing"""
-        if not text_parts:
-            return ""
-        
-        combined_parts: list[str] = []
-        
-        for i, part in enumerate(text_parts):
-            text = part['text']
-            
-            # Fix common spacing issues
-            text = self._fix_text_spacing(text)
-            
-            # Add space between parts if needed
-            if i > 0:
-                prev_part = text_parts[i-1]
-                # Calculate distance between text parts
-                x_distance = abs(part['x'] - (prev_part['x'] + len(prev_part['text']) * 5))  # Rough estimate
-                
-                # Add space if parts are separated
-                if x_distance > 10 and not text.startswith(' ') and not combined_parts[-1].endswith(' '):
-                    combined_parts.append(' ')
-            
-            combined_parts.append(text)
-        
-        combined_text = ''.join(combined_parts)
-        
-        # Apply additional spacing fixes
-        return self._fix_text_spacing(combined_text)
+        # Join with single spaces; one pass over the whole paragraph fixes
+        # each part and collapses any doubled spaces at the joins
+        return self._fix_text_spacing(' '.join(part['text'] for part in text_parts))
     
     def _fix_text_spacing(self, text: str) -> str:
         """Fix common text spacing issues"""
-        original_text = text
-        
-        # Fix missing spaces between words (common in PDF extraction)
-        # Pattern: lowercase letter followed by uppercase letter
-        text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
-        
-        # Fix missing spaces after punctuation
-        text = re.sub(r'([.!?])([A-Z])', r'\1 \2', text)
+        # Lowercase text with single spaces and no digits has nothing to fix
+        if text.islower() and not _RE_FIX_SPACING_TRIGGER.search(text):
+            return text
         
-        # Fix missing spaces around common words
-        text = re.sub(r'([a-z])(of|and|the|in|on|at|by|for|with|to)([A-Z])', r'\1 \2 \3', text)
-        
-        # Fix missing spaces before numbers
-        text = re.sub(r'([a-z])(\d)', r'\1 \2', text)
+        original_text = text
         
-        # Fix multiple spaces
-        text = re.sub(r'\s+', ' ', text)
+        # Fix missing spaces between words and after punctuation, and
+        # collapse multiple spaces
+        text = _RE_FIX_SPACING.sub(' ', text)
         
         if text != original_text:
             self.conversion_stats['spacing_fixes_applied'] += 1
         
         return text
     
-    def _apply_font_formatting(self, run: Any, text_part: TextBlock) -> None:
-        """Apply font formatting to a text run"""
-        try:
-            font = run.font
-            
-            # Set font name
-            font_name = text_part.get('font_name', 'Calibri')
-            
+    def _get_run_properties_xml(self, text_part: TextBlock) -> str:
+        """Return the cached w:rPr XML for a span's style"""
+        # A page uses only a handful of distinct span styles
+        rpr_key = (
+            text_part.get('font_name', 'Calibri'),
+            text_part.get('font_size', 12.0),
+            text_part.get('flags', 0),
+            text_part.get('color', 0)
+        )
+        rpr_xml = self._rpr_cache.get(rpr_key)
+        if rpr_xml is None:
+            rpr_xml = self._rpr_cache[rpr_key] = self._build_run_properties_xml(*rpr_key)
+        return rpr_xml
+
+    @staticmethod
+    def _build_run_xml(text: str, rpr_xml: str) -> str:
+        """Build the WordprocessingML for a single formatted text run"""
+        return (
+            f'<w:r>{rpr_xml}'
+            f'<w:t xml:space="preserve">{escape(_XML_INVALID_CHARS.sub("", text))}</w:t></w:r>'
+        )
+
+    def _build_run_properties_xml(self, font_name: str, font_size: float, flags: int, color: int) -> str:
+        """Build the w:rPr element for a span style"""
+        font_attr = quoteattr(self._resolve_font_name(font_name))
+
+        font_size = max(8, min(72, font_size))  # Clamp between 8 and 72 pt
+
+        # MuPDF packs sRGB as 0xRRGGBB, which is already the w:color hex value;
+        # black is the default, so skip it
+        color_xml = f'<w:color w:val="{color:06X}"/>' if color else ''
+
+        bi_xml = BI_LUT[((flags >> 3) & 2) | ((flags >> 1) & 1)]
+
+        return (
+            f'<w:rPr><w:rFonts w:ascii={font_attr} w:hAnsi={font_attr}/>{bi_xml}{color_xml}'
+            f'<w:sz w:val="{int(font_size * 2)}"/></w:rPr>'
+        )
+
+    def _append_body_element(self, element: Any) -> None:
+        """Queue a block-level element for the document body"""
+        self._pending_body_elements.append(element)
+
+    def _flush_body_elements(self) -> None:
+        """Write queued elements to the body in one call, keeping sectPr last"""
+        if not self._pending_body_elements:
+            return
+        body = self.docx_document.element.body
+        sect_pr = body.sectPr
+        body.extend(self._pending_body_elements)
+        if sect_pr is not None:
+            body.append(sect_pr)  # Moves the existing sectPr back to the end
+        self._pending_body_elements = []
+    
+    def _resolve_font_name(self, font_name: str) -> str:
+        """Map a PDF font name to the DOCX font name, cached per PDF font name"""
+        resolved = self._font_resolve_cache.get(font_name)
+        if resolved is None:
             # Check if we have a custom font mapping
             custom_font = self._get_custom_font(font_name)
-            if custom_font:
-                font.name = custom_font.name
-            else:
-                # Clean and set font name
-                clean_font_name = self._clean_font_name(font_name)
-                font.name = clean_font_name
-            
-            # Set font size
-            font_size = text_part.get('font_size', 12.0)
-            font.size = Pt(max(8, min(72, font_size)))  # Clamp between 8 and 72 pt
-            
-        except Exception as e:
-            logger.warning(f"Failed to apply font formatting: {e}")
-    
+            resolved = custom_font.name if custom_font else self._clean_font_name(font_name)
+            self._font_resolve_cache[font_name] = resolved
+        return resolved
+
     def _get_custom_font(self, font_name: str) -> Optional[FontInfo]:
         """Get custom font mapping if available"""
-        for custom_font in self.custom_fonts:
-            if font_name.lower() in custom_font.name.lower():
+        font_name_lower = font_name.lower()
+        custom_font = self._custom_font_index.get(font_name_lower)
+        if custom_font is not None:
+            return custom_font
+
+        # Fall back to a partial match against the registered names
+        for custom_name_lower, custom_font in self._custom_font_index.items():
+            if font_name_lower in custom_name_lower:
                 return custom_font
         return None
     
@@ -539,90 +823,83 @@ class ModernPDF2DOCXConverter:
             return 'Calibri'
         
         # Remove common prefixes and suffixes
-        font_name = re.sub(r'^[A-Z]+\+', '', font_name)  # Remove subset prefix
-        font_name = re.sub(r'[,\-].*$', '', font_name)   # Remove variants
+        font_name = _RE_FONT_SUBSET_PREFIX.sub('', font_name)  # Remove subset prefix
+        font_name = _RE_FONT_VARIANT.sub('', font_name)        # Remove variants
         
         # Map common PDF fonts to Word fonts
-        font_mapping = {
-            'Times': 'Times New Roman',
-            'Helvetica': 'Arial',
-            'Courier': 'Courier New',
-            'Symbol': 'Symbol',
-            'ZapfDingbats': 'Wingdings'
-        }
-        
-        for pdf_font, word_font in font_mapping.items():
-            if pdf_font.lower() in font_name.lower():
+        font_name_lower = font_name.lower()
+        for pdf_font, word_font in FONT_MAPPING:
+            if pdf_font in font_name_lower:
                 return word_font
         
         return font_name if font_name else 'Calibri'
     
-    def _apply_paragraph_formatting(self, paragraph: Any, paragraph_data: ParagraphData) -> None:
-        """Apply paragraph-level formatting"""
-        try:
-            paragraph_format = paragraph.paragraph_format
-            
-            # Set line spacing
-            paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
-            
-            # Set spacing before/after
-            paragraph_format.space_before = Pt(0)
-            paragraph_format.space_after = Pt(6)
-            
-        except Exception as e:
-            logger.warning(f"Failed to apply paragraph formatting: {e}")
+    def _get_image_box_inches(self) -> tuple[float, float]:
+        """Return the (width, height) in inches available inside the page margins"""
+        section = self.docx_document.sections[0]
+        
+        # Convert margins to inches first
+        max_width = section.page_width.inches - section.left_margin.inches - section.right_margin.inches
+        max_height = section.page_height.inches - section.top_margin.inches - section.bottom_margin.inches
+        return max_width, max_height
+    
+    def _fit_image_size(self, width: int, height: int) -> tuple[Inches, Inches]:
+        """Size an image of ``width`` x ``height`` pixels to fit within the page margins"""
+        # Calculate appropriate size (fit within page margins)
+        max_width_inches, max_height_inches = self._image_box_inches
+        
+        # Convert pixels to inches (assuming 72 DPI)
+        original_width_inches = width / POINTS_PER_INCH
+        original_height_inches = height / POINTS_PER_INCH
+        
+        # If dimensions are 0, use default values
+        if original_width_inches <= 0 or original_height_inches <= 0:
+            original_width_inches = 6.0  # Default width
+            original_height_inches = 8.0  # Default height
+        
+        # Calculate scaling to fit within margins
+        width_scale = max_width_inches / original_width_inches
+        height_scale = max_height_inches / original_height_inches
+        scale = min(width_scale, height_scale, 1.0)  # Don't upscale
+        
+        # Calculate final dimensions
+        return Inches(original_width_inches * scale), Inches(original_height_inches * scale)
     
     def _add_image_to_document(self, image_data: ImageData) -> None:
         """Add an image to the DOCX document"""
         try:
             if not self.docx_document:
                 return
-                
-            # Create image from data
-            image_stream = BytesIO(image_data['data'])
-            
-            # Calculate appropriate size (fit within page margins)
-            section = self.docx_document.sections[0]
-            
-            # Convert margins to inches first
-            max_width = section.page_width.inches - section.left_margin.inches - section.right_margin.inches
-            max_height = section.page_height.inches - section.top_margin.inches - section.bottom_margin.inches
-            
-            # Get original image dimensions
-            original_width = image_data['width']
-            original_height = image_data['height']
-            
-            # Use directly in inches
-            max_width_inches = max_width
-            max_height_inches = max_height
-            
-            # Convert pixels to inches (assuming 72 DPI)
-            original_width_inches = original_width / 72
-            original_height_inches = original_height / 72
-            
-            # If dimensions are 0, use default values
-            if original_width_inches <= 0 or original_height_inches <= 0:
-                original_width_inches = 6.0  # Default width
-                original_height_inches = 8.0  # Default height
-            
-            # Calculate scaling to fit within margins
-            width_scale = max_width_inches / original_width_inches
-            height_scale = max_height_inches / original_height_inches
-            scale = min(width_scale, height_scale, 1.0)  # Don't upscale
             
-            # Calculate final dimensions
-            final_width = Inches(original_width_inches * scale)
-            final_height = Inches(original_height_inches * scale)
-            
-            # Add image to document
-            paragraph = self.docx_document.add_paragraph()
-            run = paragraph.add_run()
-            run.add_picture(image_stream, width=final_width, height=final_height)
-            
-            # Center the image
-            paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            # Embed and size each PDF image once; repeats (logos, headers)
+            # reuse the same image part and final dimensions
+            part = self.docx_document.part
+            image_ref = self._image_refs.get(image_data['xref'])
+            if image_ref is None:
+                final_width, final_height = self._fit_image_size(image_data['width'], image_data['height'])
+                r_id, image = part.get_or_add_image(BytesIO(image_data['data']))
+                image_ref = self._image_refs[image_data['xref']] = (
+                    r_id, image.filename, final_width, final_height
+                )
+
+                # The package now holds its own copy of the bytes; point the
+                # cache at it so the extracted copy isn't kept alive until the
+                # whole PDF is converted. The page dicts are left untouched.
+                cached = self._image_cache.get(image_data['xref'])
+                if cached is not None:
+                    cached['data'] = image.blob
+            inline = CT_Inline.new_pic_inline(self._next_shape_id, *image_ref)
+            self._next_shape_id += 1
+
+            # Centered image paragraph, queued behind any text still pending
+            paragraph = parse_xml(IMAGE_PARAGRAPH_XML)
+            paragraph[-1].add_drawing(inline)
+            self._append_body_element(paragraph)
             
-            logger.info(f"Added image: {image_data['name']} ({final_width.inches:.1f}\" x {final_height.inches:.1f}\")")
+            # Per-image message: skip the formatting when INFO is filtered out
+            if logger.isEnabledFor(logging.INFO):
+                _, _, final_width, final_height = image_ref
+                logger.info(f"Added image: {image_data['name']} ({final_width.inches:.1f}\" x {final_height.inches:.1f}\")")
             
         except Exception as e:
             logger.warning(f"Failed to add image {image_data['name']}: {e}")
@@ -636,7 +913,8 @@ class ModernPDF2DOCXConverter:
         password: Optional[str] = None, 
         start_page: int = 0, 
         end_page: Optional[int] = None, 
-        pages: Optional[list[int]] = None
+        pages: Optional[list[int]] = None,
+        workers: Optional[int] = None
     ) -> ConversionResult:
         """
         Convert PDF to DOCX with proper text extraction and template formatting
@@ -650,6 +928,7 @@ class ModernPDF2DOCXConverter:
             start_page: Starting page (0-indexed)
             end_page: Ending page (exclusive)
             pages: Specific pages to convert
+            workers: Extraction processes (default: one per CPU, at most 4; 1 = serial)
             
         Returns:
             Dict with conversion results
@@ -670,19 +949,29 @@ class ModernPDF2DOCXConverter:
             if font_paths:
                 self.register_fonts(font_paths)
             
-            # Extract content from PDF
-            extracted_content = self.extract_pdf_content(
-                pdf_path, password, start_page, end_page, pages
-            )
-            
-            if not extracted_content:
+            # Keep the PDF open for the whole conversion: pages are extracted
+            # while the DOCX is being built, and the handle is released even
+            # if building fails part way
+            try:
+                pdf_document = fitz.open(pdf_path, filetype="pdf")
+            except Exception as e:
+                logger.error(f"Failed to extract PDF content: {e}")
                 return {'status': 'error', 'error': 'Failed to extract PDF content'}
-            
-            # Create DOCX document
-            document = self.create_docx_document(extracted_content, template_path)
+
+            with pdf_document:
+                # Extract content from PDF
+                extracted_content = self.extract_pdf_content(
+                    pdf_path, password, start_page, end_page, pages, workers, pdf_document
+                )
+                
+                if not extracted_content:
+                    return {'status': 'error', 'error': 'Failed to extract PDF content'}
+                
+                # Create DOCX document
+                document = self.create_docx_document(extracted_content, template_path)
             
             # Save document
-            document.save(output_path)
+            self._save_document(document, output_path)
             
             # Prepare result
             result: ConversionResult = {
@@ -702,6 +991,143 @@ class ModernPDF2DOCXConverter:
             logger.error(error_msg)
             return {'status': 'error', 'error': error_msg}
 
+    @staticmethod
+    def _save_document(document: Any, output_path: str) -> None:
+        """Save the document using the fast-deflate package writer
+
+        Same steps as ``Document.save``, but with a writer of our own rather
+        than swapping python-docx's module-level factory, so concurrent
+        saves on other threads are unaffected.
+        """
+        package = document.part.package
+        for part in package.parts:
+            part.before_marshal()
+        phys_writer = _FastZipPkgWriter(output_path)
+        try:
+            PackageWriter._write_content_types_stream(phys_writer, package.parts)
+            PackageWriter._write_pkg_rels(phys_writer, package.rels)
+            PackageWriter._write_parts(phys_writer, package.parts)
+        finally:
+            phys_writer.close()
+
+def is_docx_image(image_data: bytes) -> bool:
+    """Check whether python-docx recognizes the encoded image format"""
+    return any(
+        image_data[offset:offset + len(signature)] == signature
+        for _, offset, signature in DOCX_IMAGE_SIGNATURES
+    )
+
+def reencode_as_png(pdf_document: fitz.Document, xref: int) -> bytes:
+    """Decode an image XObject with MuPDF and re-encode it as PNG"""
+    pix = fitz.Pixmap(pdf_document, xref)
+    if pix.n - pix.alpha >= 4:  # PNG has no CMYK support
+        pix = fitz.Pixmap(fitz.csRGB, pix)
+    return pix.tobytes("png")
+
+def _assign_line_ids(ys: Any, by_y: Any, y_threshold: float) -> Any:
+    """Assign line ids top to bottom: a block joins the current line while
+    it stays within the threshold of the line's first block"""
+    line_ids = np.empty(ys.shape[0], dtype=np.int64)
+    line_id = 0
+    line_y = ys[by_y[0]]
+    for idx in by_y:
+        if ys[idx] - line_y > y_threshold:
+            line_id += 1
+            line_y = ys[idx]
+        line_ids[idx] = line_id
+    return line_ids
+
+if NUMBA_AVAILABLE:
+    # Cache the compiled kernel on disk so only the first run pays for JIT
+    _assign_line_ids = njit(cache=True)(_assign_line_ids)
+
+# Process-wide extraction pool, started on first use and shared by every
+# caller in the process (this converter and core.pdf_extraction)
+_extract_pool: Optional[ProcessPoolExecutor] = None
+_extract_pool_size = 0
+_extract_pool_lock = threading.Lock()
+
+def get_extract_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared extraction pool of ``workers`` processes, starting
+    it on first use
+
+    Workers stay warm (PyMuPDF already imported) across conversions instead
+    of being spawned and torn down for every PDF. Asking for another size
+    replaces the pool; the old one shuts down by itself once no running
+    extraction holds it any more.
+    """
+    global _extract_pool, _extract_pool_size
+    with _extract_pool_lock:
+        if _extract_pool is None or _extract_pool_size != workers:
+            _extract_pool = ProcessPoolExecutor(max_workers=workers)
+            _extract_pool_size = workers
+        return _extract_pool
+
+def discard_extract_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a pool that raised BrokenProcessPool so the next call starts a fresh one"""
+    global _extract_pool
+    with _extract_pool_lock:
+        if _extract_pool is pool:
+            _extract_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def iter_pages_in_pool(
+    extract_range: Callable[[list[int]], list[Any]],
+    page_indices: list[int],
+    workers: int
+) -> Iterator[Any]:
+    """Run ``extract_range`` over short runs of ``page_indices`` in the
+    shared pool, yielding the extracted pages in page order
+
+    At most ``2 * workers`` runs are in flight, and another is submitted
+    each time a finished run is taken, so the pages waiting to be consumed
+    are bounded by that window rather than by the length of the PDF.
+    """
+    run_size = max(1, min(PAGES_PER_TASK, len(page_indices) // workers))
+    page_runs = (
+        page_indices[i:i + run_size]
+        for i in range(0, len(page_indices), run_size)
+    )
+    pool = get_extract_pool(workers)
+    pending: deque[Future] = deque()
+    try:
+        for page_run in islice(page_runs, 2 * workers):
+            pending.append(pool.submit(extract_range, page_run))
+        while pending:
+            pages = pending.popleft().result()
+            # Keep the workers busy while the caller handles these pages
+            for page_run in islice(page_runs, 1):
+                pending.append(pool.submit(extract_range, page_run))
+            yield from pages
+    except BrokenProcessPool:
+        # A dead worker poisons the pool; start fresh on the next call
+        discard_extract_pool(pool)
+        raise
+    finally:
+        # Abandoned part way: drop the runs no worker has started yet
+        for future in pending:
+            future.cancel()
+
+def _extract_page_range(
+    pdf_path: str,
+    password: Optional[str],
+    page_indices: list[int],
+    plain_text: bool = False
+) -> list[PageContent]:
+    """Worker process entry point: extract a run of pages with its own document handle"""
+    converter = ModernPDF2DOCXConverter()
+    converter.plain_text = plain_text
+    converter.pdf_document = fitz.open(pdf_path, filetype="pdf")
+    try:
+        if converter.pdf_document.needs_pass:
+            converter.pdf_document.authenticate(password or '')
+        return [
+            converter._extract_page_content(converter.pdf_document[page_idx], page_idx)
+            for page_idx in page_indices
+        ]
+    finally:
+        converter.pdf_document.close()
+
 def main() -> None:
     """Command line interface"""
     import argparse
@@ -715,6 +1141,8 @@ def main() -> None:
     parser.add_argument('--start-page', type=int, default=0, help='Start page (0-indexed)')
     parser.add_argument('--end-page', type=int, help='End page (exclusive)')
     parser.add_argument('--pages', nargs='+', type=int, help='Specific pages to convert')
+    parser.add_argument('--workers', type=int, help='Extraction processes (default: CPU count, max 4; 1 = serial)')
+    parser.add_argument('--plain', action='store_true', help='Plain text mode: skip layout and font formatting')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     
     args = parser.parse_args()
@@ -724,6 +1152,7 @@ def main() -> None:
     
     # Create converter
     converter = ModernPDF2DOCXConverter()
+    converter.plain_text = args.plain
     
     # Perform conversion
     result = converter.convert_pdf_to_docx(
@@ -734,7 +1163,8 @@ def main() -> None:
         password=args.password,
         start_page=args.start_page,
         end_page=args.end_page,
-        pages=args.pages
+        pages=args.pages,
+        workers=args.workers
     )
     
     # Print results
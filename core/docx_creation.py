@@ -4,12 +4,12 @@ Handles document assembly, formatting, and template application
 """
 
 from docx import Document
-from docx.shared import Inches, Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
-from docx.enum.section import WD_ORIENT
-from typing import Dict, List, Any
+from docx.oxml.ns import qn
+from typing import Dict, Iterable, List, Any, Union
 import logging
 
+from converters.modern_pdf2docx_converter import ModernPDF2DOCXConverter, PageContent
+
 class DOCXCreator:
     """Creates DOCX documents from extracted PDF content"""
     
@@ -19,15 +19,24 @@ class DOCXCreator:
         self.custom_fonts = []
         self.logger = logging.getLogger('docx_creation')
         
-    def create_from_pdf_data(self, pdf_data: Dict) -> Document:
-        """Create DOCX from extracted PDF content"""
+    def create_from_pdf_data(self, pdf_data: Union[Dict, Iterable[Dict]]) -> Document:
+        """Create DOCX from extracted PDF content
+
+        Accepts either the dict from ``PDFExtractor.extract_content`` or the
+        page iterator from ``PDFExtractor.iter_pages``; in the latter case
+        ``pdf_data['pages']`` is consumed once, page by page.
+        """
+        if not isinstance(pdf_data, dict):
+            pdf_data = {'pages': iter(pdf_data)}
+            
         if self.template_path:
             self.docx_document = Document(self.template_path)
-            # Clear existing content but keep styles
-            for element in list(self.docx_document.element.body):
-                if element.tag.endswith(('sectPr', 'sectPr')):
-                    continue
-                self.docx_document.element.body.remove(element)
+            # Clear existing content but keep styles and the trailing section properties
+            body = self.docx_document.element.body
+            sect_pr = body.find(qn('w:sectPr'))
+            body.clear()
+            if sect_pr is not None:
+                body.append(sect_pr)
         else:
             self.docx_document = Document()
             
@@ -40,8 +49,23 @@ class DOCXCreator:
         # [Implementation from modern_pdf2docx_converter.py]
         
     def _add_content(self, pdf_data: Dict) -> None:
-        """Add content to document"""
-        # [Implementation from modern_pdf2docx_converter.py]
+        """Add content to document
+
+        Pages go through the converter's page builder: body XML is queued and
+        written once, and each PDF image (by xref) is embedded and sized once.
+        """
+        builder = ModernPDF2DOCXConverter()
+        builder.plain_text = True  # Extracted blocks are whole paragraphs
+        builder.docx_document = self.docx_document
+        builder.add_pages_to_document(
+            PageContent(
+                page_number=page_content.get('page_number', page_idx),
+                text_blocks=page_content.get('text_blocks', []),
+                images=page_content.get('images', []),
+                page_size=page_content.get('page_size', {})
+            )
+            for page_idx, page_content in enumerate(pdf_data.get('pages', ()))
+        )
         
     def save(self, output_path: str) -> None:
         """Save document to file"""
@@ -4,13 +4,30 @@ Handles all PDF parsing, content extraction, and structure detection
 """
 
 import fitz  # PyMuPDF
-from typing import Dict, List, Optional
+import os
+from functools import partial
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional
 import logging
 
+# One extraction pool per process, shared with the converter
+from converters.modern_pdf2docx_converter import (
+    MAX_EXTRACT_WORKERS, MIN_PARALLEL_PAGES, STORE_SHRINK_PERCENT, is_docx_image,
+    iter_pages_in_pool, reencode_as_png
+)
+
 class PDFExtractor:
-    """Extracts content from PDF files with layout preservation"""
+    """Extracts content from PDF files with layout preservation
+
+    Used as a context manager, the PDF is opened once and stays open for
+    every call until the block exits:
+
+        with PDFExtractor(pdf_path) as extractor:
+            content = extractor.extract_content()
+    """
     
-    def __init__(self):
+    def __init__(self, pdf_path: str = None):
+        self.pdf_path = pdf_path
         self.pdf_document = None
         self.conversion_stats = {
             'pages_processed': 0,
@@ -19,12 +36,58 @@ class PDFExtractor:
         }
         self.logger = logging.getLogger('pdf_extraction')
         
-    def extract_content(self, pdf_path: str, password: str = None,
+    def __enter__(self) -> 'PDFExtractor':
+        if self.pdf_path is None:
+            raise ValueError("PDFExtractor needs a pdf_path to open")
+        self.pdf_document = fitz.open(self.pdf_path)
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self.pdf_document is not None:
+            self.pdf_document.close()
+            self.pdf_document = None
+        
+    def extract_content(self, pdf_path: str = None, password: str = None,
                       start_page: int = 0, end_page: int = None,
-                      pages: List[int] = None) -> Dict:
-        """Main extraction method"""
+                      pages: List[int] = None, num_workers: int = None) -> Dict:
+        """Main extraction method
+
+        Collects ``iter_pages`` into a single dict; use ``iter_pages``
+        directly to hold only a few pages in memory at a time.
+        """
+        self._resolve_pdf_path(pdf_path)
+        try:
+            page_contents = list(self.iter_pages(
+                pdf_path, password, start_page, end_page, pages, num_workers
+            ))
+        except Exception as e:
+            self.logger.error(f"Extraction failed: {e}")
+            return {}
+        
+        return {
+            'pages': page_contents,
+            'total_pages': len(page_contents),
+            'page_indices': [page['page_number'] for page in page_contents]
+        }
+    
+    def iter_pages(self, pdf_path: str = None, password: str = None,
+                   start_page: int = 0, end_page: int = None,
+                   pages: List[int] = None, num_workers: int = None) -> Iterator[Dict]:
+        """Yield extracted page dicts one at a time, in page order
+
+        Pages are spread over ``num_workers`` processes (default: one per
+        CPU, at most MAX_EXTRACT_WORKERS); ``num_workers=1`` extracts
+        serially in this process. In parallel, at most ``2 * num_workers``
+        short runs of pages are extracted ahead of the consumer.
+        
+        Outside a ``with`` block the PDF at ``pdf_path`` is opened for this
+        iteration only and closed once it finishes or is abandoned.
+        """
+        pdf_path = self._resolve_pdf_path(pdf_path)
+        owns_document = self.pdf_document is None
         try:
-            self.pdf_document = fitz.open(pdf_path)
+            if owns_document:
+                self.pdf_document = fitz.open(pdf_path)
             
             # Handle password protection
             if self.pdf_document.needs_pass:
@@ -45,28 +108,56 @@ class PDFExtractor:
                 end = min(total_pages, end_page) if end_page else total_pages
                 page_indices = list(range(start, end))
             
-            extracted_content = {
-                'pages': [],
-                'total_pages': len(page_indices),
-                'page_indices': page_indices
-            }
+            if num_workers is None:
+                num_workers = min(os.cpu_count() or 1, MAX_EXTRACT_WORKERS)
             
-            # Extract content from each page
-            for page_idx in page_indices:
-                page = self.pdf_document[page_idx]
-                page_content = self._extract_page_content(page, page_idx)
-                extracted_content['pages'].append(page_content)
-                self.conversion_stats['pages_processed'] += 1
+            if num_workers > 1 and len(page_indices) >= MIN_PARALLEL_PAGES:
+                # Workers re-open the PDF and extract short runs of pages
+                yield from self._extract_pages_parallel(
+                    pdf_path, password, page_indices, num_workers
+                )
+            else:
+                # Extract content from each page
+                for page_idx in page_indices:
+                    page = self.pdf_document[page_idx]
+                    page_content = self._extract_page_content(page, page_idx)
+                    self.conversion_stats['pages_processed'] += 1
+                    yield page_content
             
             self.logger.info(f"Extracted content from {len(page_indices)} pages")
-            return extracted_content
             
-        except Exception as e:
-            self.logger.error(f"Extraction failed: {e}")
-            return {}
         finally:
-            if hasattr(self, 'pdf_document'):
+            if owns_document and self.pdf_document is not None:
                 self.pdf_document.close()
+                self.pdf_document = None
+            
+    def _resolve_pdf_path(self, pdf_path: Optional[str]) -> str:
+        """Return the PDF to read: ``pdf_path``, or the one given to the constructor
+        
+        Inside a ``with`` block only the open document can be read; serial
+        extraction uses it while workers re-open the path, so a different
+        ``pdf_path`` would mix two files.
+        """
+        if pdf_path is None:
+            if self.pdf_path is None:
+                raise ValueError("No PDF given: pass pdf_path here or to PDFExtractor()")
+            return self.pdf_path
+        if (self.pdf_document is not None and self.pdf_path is not None
+                and os.path.abspath(pdf_path) != os.path.abspath(self.pdf_path)):
+            raise ValueError(f"{pdf_path} is not the PDF open in this extractor ({self.pdf_path})")
+        return pdf_path
+        
+    def _extract_pages_parallel(self, pdf_path: str, password: Optional[str],
+                                page_indices: List[int], num_workers: int) -> Iterator[Dict]:
+        """Extract pages in worker processes, yielding them in page order"""
+        for page_content in iter_pages_in_pool(
+            partial(_extract_page_range, pdf_path, password), page_indices, num_workers
+        ):
+            # Worker stats stay in the workers; recount from the returned pages
+            self.conversion_stats['pages_processed'] += 1
+            self.conversion_stats['text_blocks_extracted'] += len(page_content['text_blocks'])
+            self.conversion_stats['images_extracted'] += len(page_content['images'])
+            yield page_content
             
     def _extract_page_content(self, page, page_idx: int) -> Dict:
         """Extract text and images from a single PDF page"""
@@ -90,6 +181,10 @@ class PDFExtractor:
         page_content['images'] = images
         self.conversion_stats['images_extracted'] += len(images)
         
+        # MuPDF's resource store is unbounded by default; evict the least
+        # recently used half after every page so long PDFs don't grow RSS
+        fitz.TOOLS.store_shrink(STORE_SHRINK_PERCENT)
+        
         return page_content
         
     def _extract_text_with_layout(self, page) -> List[Dict]:
@@ -99,37 +194,24 @@ class PDFExtractor:
         try:
             # Use PyMuPDF blocks method for better text spacing
             blocks = page.get_text("blocks")
-            page_text_parts = []
             
-            for block in blocks:
-                if len(block) >= 5 and block[4].strip():  # Text block
-                    text = block[4].strip()
-                    bbox = block[:4]  # x0, y0, x1, y1
-                    
-                    page_text_parts.append({
-                        'text': text,
-                        'x': bbox[0],
-                        'y': bbox[1],
-                        'bbox': bbox
-                    })
-            
-            # Sort by position (top to bottom, left to right)
+            # Sort the raw (x0, y0, x1, y1, text, ...) tuples by position
+            # (top to bottom, left to right) before building any dicts.
             # In PDF coordinates, Y increases downward, so we sort by Y ascending
-            page_text_parts.sort(key=lambda p: (p['y'], p['x']))
+            blocks.sort(key=itemgetter(1, 0))
             
-            # Combine text parts with proper spacing
-            if page_text_parts:
-                combined_text = ' '.join([part['text'] for part in page_text_parts])
-                
-                text_blocks.append({
-                    'text': combined_text.strip(),
-                    'x': page_text_parts[0]['x'],
-                    'y': page_text_parts[0]['y'],
+            text_blocks = [
+                {
+                    'text': block[4].strip(),
+                    'x': block[0],
+                    'y': block[1],
+                    'bbox': block[:4],  # x0, y0, x1, y1
                     'font_name': 'Unknown',
-                    'font_size': 12.0,
-                    'matrix': [1, 0, 0, 1, 0, 0],
-                    'parts': page_text_parts
-                })
+                    'font_size': 12.0
+                }
+                for block in blocks
+                if len(block) >= 5 and block[4].strip()  # Text block
+            ]
             
         except Exception as e:
             self.logger.warning(f"PyMuPDF text extraction failed: {e}")
@@ -142,8 +224,7 @@ class PDFExtractor:
                         'x': 0,
                         'y': 0,
                         'font_name': 'Unknown',
-                        'font_size': 12.0,
-                        'matrix': [1, 0, 0, 1, 0, 0]
+                        'font_size': 12.0
                     })
             except Exception as e2:
                 self.logger.error(f"Fallback text extraction also failed: {e2}")
@@ -152,9 +233,6 @@ class PDFExtractor:
         
     def _extract_images_from_page(self, page, page_idx: int) -> List[Dict]:
         """Extract images from a PDF page using PyMuPDF"""
-        from io import BytesIO
-        from PIL import Image
-        
         images = []
         
         try:
@@ -162,32 +240,29 @@ class PDFExtractor:
             
             for img_idx, img in enumerate(image_list):
                 try:
-                    # Get image reference
-                    xref = img[0]
+                    # Get image reference and pixel size from the image dictionary:
+                    # (xref, smask, width, height, bpc, colorspace, ...)
+                    xref, _, width, height = img[:4]
                     
-                    # Extract image data
+                    # Extract image data; keep the original encoded bytes and
+                    # re-encode only formats python-docx cannot read (JPX, ...)
                     base_image = self.pdf_document.extract_image(xref)
                     image_data = base_image["image"]
                     image_ext = base_image["ext"]
+                    if not is_docx_image(image_data):
+                        image_data = reencode_as_png(self.pdf_document, xref)
+                        image_ext = 'png'
                     
                     # Create image name
                     image_name = f"image_{page_idx}_{img_idx}.{image_ext}"
                     
-                    # Try to get image dimensions
-                    try:
-                        pil_image = Image.open(BytesIO(image_data))
-                        width, height = pil_image.size
-                        format_type = pil_image.format
-                    except Exception:
-                        width, height = 100, 100  # Default size
-                        format_type = image_ext.upper()
-                    
                     image_info = {
                         'name': image_name,
+                        'xref': xref,
                         'data': image_data,
-                        'width': width,
-                        'height': height,
-                        'format': format_type,
+                        'width': width or 100,  # Default size
+                        'height': height or 100,
+                        'format': image_ext.upper(),
                         'page_number': page_idx,
                         'index': img_idx
                     }
@@ -211,3 +286,19 @@ class PDFExtractor:
         # [Implementation from modern_pdf2docx_converter.py]
         
     # Other extraction methods...
+
+
+def _extract_page_range(pdf_path: str, password: Optional[str],
+                        page_indices: List[int]) -> List[Dict]:
+    """Worker process entry point: extract a run of pages with its own document handle"""
+    extractor = PDFExtractor()
+    extractor.pdf_document = fitz.open(pdf_path)
+    try:
+        if extractor.pdf_document.needs_pass:
+            extractor.pdf_document.authenticate(password or '')
+        return [
+            extractor._extract_page_content(extractor.pdf_document[page_idx], page_idx)
+            for page_idx in page_indices
+        ]
+    finally:
+        extractor.pdf_document.close()
@@ -0,0 +1,46 @@
+"""
+Shared fixtures: small PDFs built from samples/basic-text.pdf
+"""
+
+from pathlib import Path
+
+import fitz  # PyMuPDF
+import pytest
+
+SAMPLE_PDF = Path(__file__).resolve().parent.parent / "samples" / "basic-text.pdf"
+
+
+def solid_png(gray: int, width: int = 40, height: int = 20) -> bytes:
+    """A small solid-gray PNG"""
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, width, height), False)
+    pix.clear_with(gray)
+    return pix.tobytes("png")
+
+
+@pytest.fixture
+def sample_pdf():
+    """Path of samples/basic-text.pdf (written by test_basic_text_extraction)"""
+    if not SAMPLE_PDF.exists():
+        pytest.skip(f"{SAMPLE_PDF} not found (test_basic_text_extraction creates it)")
+    return str(SAMPLE_PDF)
+
+
+@pytest.fixture
+def multipage_pdf(sample_pdf, tmp_path):
+    """Six copies of the sample page; every page repeats one logo image
+    and the second page adds an image of its own"""
+    sample = fitz.open(sample_pdf)
+    doc = fitz.open()
+    logo, extra = solid_png(64), solid_png(192)
+    for page_idx in range(6):
+        doc.insert_pdf(sample, from_page=0, to_page=0)
+        page = doc[page_idx]
+        page.insert_text((72, 120), f"Page{page_idx}of the sample", fontsize=12)
+        page.insert_image(fitz.Rect(72, 200, 152, 240), stream=logo)
+        if page_idx == 1:
+            page.insert_image(fitz.Rect(72, 300, 152, 340), stream=extra)
+    path = tmp_path / "multipage.pdf"
+    doc.save(path)
+    doc.close()
+    sample.close()
+    return str(path)
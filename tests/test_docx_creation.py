@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests for core.docx_creation.DOCXCreator
+"""
+
+import re
+import zipfile
+
+import fitz  # PyMuPDF
+
+from converters.modern_pdf2docx_converter import is_docx_image, reencode_as_png
+from core.docx_creation import DOCXCreator
+from core.pdf_extraction import PDFExtractor
+
+
+def _saved_parts(docx_path):
+    with zipfile.ZipFile(docx_path) as docx_zip:
+        document_xml = docx_zip.read('word/document.xml').decode('utf-8')
+        media = [name for name in docx_zip.namelist() if name.startswith('word/media/')]
+    return document_xml, media
+
+
+def test_repeated_images_are_embedded_once(multipage_pdf, tmp_path):
+    creator = DOCXCreator()
+    with PDFExtractor(multipage_pdf) as extractor:
+        creator.create_from_pdf_data(extractor.iter_pages())
+    output_path = tmp_path / "out.docx"
+    creator.save(str(output_path))
+
+    document_xml, media = _saved_parts(output_path)
+    shape_ids = re.findall(r'<wp:docPr id="(\d+)"', document_xml)
+    assert len(shape_ids) == 7
+    assert len(set(shape_ids)) == len(shape_ids)
+    # The logo on every page and the extra image on page 1
+    assert len(media) == 2
+    assert document_xml.count('w:type="page"') == 5
+
+
+def test_dict_and_iterator_input_build_the_same_document(multipage_pdf):
+    content = PDFExtractor(multipage_pdf).extract_content()
+    from_dict = DOCXCreator().create_from_pdf_data(content)
+    from_pages = DOCXCreator().create_from_pdf_data(iter(content['pages']))
+
+    assert [p.text for p in from_dict.paragraphs] == [p.text for p in from_pages.paragraphs]
+    assert len(from_dict.inline_shapes) == 7
+
+
+def test_control_characters_are_dropped(tmp_path):
+    pdf_data = {'pages': [{'text_blocks': [
+        {'text': 'Tom\x00 & Jerry <b>"quoted"</b>\x1f', 'x': 0, 'y': 0}
+    ]}]}
+    creator = DOCXCreator()
+    creator.create_from_pdf_data(pdf_data)
+    output_path = tmp_path / "out.docx"
+    creator.save(str(output_path))
+
+    assert creator.docx_document.paragraphs[-1].text == 'Tom & Jerry <b>"quoted"</b>'
+
+
+def test_unsupported_images_are_reencoded_as_png(multipage_pdf):
+    doc = fitz.open(multipage_pdf)
+    xref = doc[0].get_images()[0][0]
+
+    assert not is_docx_image(b'\x00\x00\x00\x0cjP  \r\n\x87\n')  # JPEG 2000 signature
+    png = reencode_as_png(doc, xref)
+    assert png.startswith(b'\x89PNG\r\n\x1a\n')
+    assert is_docx_image(png)
+    doc.close()
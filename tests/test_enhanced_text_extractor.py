@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Tests for utilities.enhanced_text_extractor.EnhancedTextExtractor
+"""
+
+from io import StringIO
+
+import fitz  # PyMuPDF
+import pytest
+
+from utilities.enhanced_text_extractor import (
+    _AVAILABLE_METHODS, _SPEED_RANK, EnhancedTextExtractor
+)
+
+
+def test_pdfminer_without_layout_skips_layout_analysis(sample_pdf):
+    pytest.importorskip('pdfminer')
+    from pdfminer.high_level import extract_text_to_fp
+
+    output = StringIO()
+    with open(sample_pdf, 'rb') as f:
+        extract_text_to_fp(f, output, laparams=None)
+
+    result = EnhancedTextExtractor()._extract_pdfminer(sample_pdf, layout=False)
+    assert result['status'] == 'success'
+    assert result['total_text']
+    assert result['total_text'] == output.getvalue().strip()
+
+
+def test_scoring_runs_pdfminer_without_layout(sample_pdf, monkeypatch):
+    pytest.importorskip('pdfminer')
+    layouts = []
+    extract_pdfminer = EnhancedTextExtractor._extract_pdfminer
+
+    def recording_extract_pdfminer(self, pdf_path, layout=True):
+        layouts.append(layout)
+        return extract_pdfminer(self, pdf_path, layout=layout)
+
+    monkeypatch.setattr(EnhancedTextExtractor, '_extract_pdfminer', recording_extract_pdfminer)
+    # The sample is too short to be good enough, so every method runs in-process
+    best_method, result = EnhancedTextExtractor().find_best_extraction_method(
+        sample_pdf, early_exit=True
+    )
+
+    assert layouts[0] is False
+    # A winning pdfminer is re-run with layout analysis for its returned text
+    assert (best_method == 'pdfminer') == (layouts[1:] == [True])
+    assert result['status'] == 'success'
+
+
+@pytest.fixture
+def wordy_pdf(sample_pdf, tmp_path):
+    """The sample page plus a paragraph long enough to count as good enough"""
+    doc = fitz.open(sample_pdf)
+    words = ' '.join(f"word{i}" for i in range(80))
+    doc[0].insert_textbox(fitz.Rect(72, 100, 520, 400), f"THE FIRST HUNDRED YEARS {words}", fontsize=10)
+    path = tmp_path / "wordy.pdf"
+    doc.save(path)
+    doc.close()
+    return str(path)
+
+
+def _record_methods_run(extractor, monkeypatch):
+    """List the method names the extractor runs from now on"""
+    methods_run = []
+    run_extraction_method = extractor._run_extraction_method
+
+    def recording_run(method_name, get_result):
+        methods_run.append(method_name)
+        return run_extraction_method(method_name, get_result)
+
+    monkeypatch.setattr(extractor, '_run_extraction_method', recording_run)
+    return methods_run
+
+
+def test_early_exit_stops_at_first_good_enough_method(wordy_pdf, monkeypatch):
+    extractor = EnhancedTextExtractor()
+    methods_run = _record_methods_run(extractor, monkeypatch)
+
+    best_method, result = extractor.find_best_extraction_method(wordy_pdf, early_exit=True)
+
+    assert methods_run == [min(methods_run, key=_SPEED_RANK.get)]
+    assert best_method == methods_run[0]
+    assert extractor._is_good_enough(result)
+
+
+def test_early_exit_keeps_going_for_short_text(sample_pdf, monkeypatch):
+    extractor = EnhancedTextExtractor()
+    methods_run = _record_methods_run(extractor, monkeypatch)
+
+    extractor.find_best_extraction_method(sample_pdf, early_exit=True)
+
+    # Fastest first, and all of them: the sample is below GOOD_ENOUGH_MIN_WORDS
+    assert methods_run == sorted((name for name, _ in extractor.extraction_methods), key=_SPEED_RANK.get)
+
+
+def test_full_comparison_keeps_registration_order(sample_pdf):
+    extractor = EnhancedTextExtractor()
+    results = extractor.compare_extraction_methods(sample_pdf, max_workers=1)
+    assert list(results) == [name for name, _ in extractor.extraction_methods]
+    assert list(results) == [name for name, _ in _AVAILABLE_METHODS]
+
+
+def test_run_together_words_are_not_good_enough():
+    extractor = EnhancedTextExtractor()
+    spaced = ' '.join(['the first hundred years'] * 20)
+    run_together = ' '.join(['thefirsthundredyears'] * 60)
+
+    assert extractor._is_good_enough({'status': 'success', 'total_text': spaced})
+    assert not extractor._is_good_enough({'status': 'success', 'total_text': run_together})
+    assert not extractor._is_good_enough({'status': 'success', 'total_text': 'too few words'})
+    assert extractor._is_good_enough(
+        {'status': 'success', 'total_text': 'too few words'}, frozenset({'too', 'few', 'words'})
+    )
+
+
+def test_process_pool_comparison_matches_in_process(sample_pdf):
+    extractor = EnhancedTextExtractor()
+    in_process = extractor.compare_extraction_methods(sample_pdf, max_workers=1)
+    pooled = extractor.compare_extraction_methods(sample_pdf, max_workers=2)
+
+    assert list(pooled) == list(in_process)
+    assert pooled == in_process
+    assert all(result['status'] == 'success' for result in pooled.values())
+
+
+@pytest.mark.parametrize('method_name', ['pymupdf_simple', 'pymupdf_dict', 'pymupdf_blocks'])
+def test_pymupdf_methods_accept_an_open_document(sample_pdf, method_name):
+    extractor = EnhancedTextExtractor()
+    method_func = dict(extractor.extraction_methods)[method_name]
+
+    with fitz.open(sample_pdf) as doc:
+        from_doc = method_func(doc)
+        # The caller's document is left open for the next method
+        assert not doc.is_closed
+    assert from_doc == method_func(sample_pdf)
+    assert from_doc['status'] == 'success'
+
+
+def test_in_process_methods_share_one_read_of_the_pdf(sample_pdf, monkeypatch):
+    extractor = EnhancedTextExtractor()
+    expected = {
+        method_name: method_func(sample_pdf) for method_name, method_func in extractor.extraction_methods
+    }
+
+    sources = []
+    shared_pdf_source = EnhancedTextExtractor._shared_pdf_source
+
+    def recording_shared_pdf_source(pdf_path):
+        source = shared_pdf_source(pdf_path)
+        sources.append(source)
+        return source
+
+    monkeypatch.setattr(EnhancedTextExtractor, '_shared_pdf_source', staticmethod(recording_shared_pdf_source))
+    opened = []
+    fitz_open = fitz.open
+
+    def recording_fitz_open(*args, **kwargs):
+        opened.append(args[0] if args else 'stream')
+        return fitz_open(*args, **kwargs)
+
+    monkeypatch.setattr(fitz, 'open', recording_fitz_open)
+
+    assert extractor.compare_extraction_methods(sample_pdf, max_workers=1) == expected
+    assert len(sources) == 1
+    # One document, opened from the bytes read up front, serves every PyMuPDF method
+    assert opened == ['stream']
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Tests for converters.modern_pdf2docx_converter.ModernPDF2DOCXConverter
+"""
+
+import re
+import sys
+import zipfile
+
+import fitz  # PyMuPDF
+import numpy as np
+import pytest
+from docx import Document
+from docx.shared import Inches
+
+import converters.modern_pdf2docx_converter as converter_module
+from converters.modern_pdf2docx_converter import (
+    TEXT_EXTRACTION_FLAGS, ModernPDF2DOCXConverter, PageContent, ParagraphData, _assign_line_ids, main
+)
+
+
+def _page(text_blocks, images=()):
+    return PageContent(
+        page_number=0,
+        text_blocks=text_blocks,
+        images=list(images),
+        page_size={'width': 612, 'height': 792}
+    )
+
+
+def test_paragraph_xml_escapes_text_and_drops_control_characters(tmp_path):
+    converter = ModernPDF2DOCXConverter()
+    block = {'text': 'Tom\x00 & Jerry <b>"quoted"</b>\x1f', 'x': 72, 'y': 72,
+             'font_name': 'Helvetica', 'font_size': 11.0, 'flags': 2, 'color': 0xFF0000}
+    document = converter.create_docx_document({'pages': [_page([block])]})
+    output_path = tmp_path / "out.docx"
+    converter._save_document(document, str(output_path))
+
+    with zipfile.ZipFile(output_path) as docx_zip:
+        assert docx_zip.testzip() is None
+    paragraph = document.paragraphs[-1]
+    assert paragraph.text == 'Tom & Jerry <b>"quoted"</b>'
+    run = paragraph.runs[0]
+    assert run.font.name == 'Arial'
+    assert run.font.italic and not run.font.bold
+    assert str(run.font.color.rgb) == 'FF0000'
+
+
+def _convert(pdf_path, output_path, **kwargs):
+    result = ModernPDF2DOCXConverter().convert_pdf_to_docx(pdf_path, str(output_path), **kwargs)
+    assert result['status'] == 'success'
+    with zipfile.ZipFile(output_path) as docx_zip:
+        return result, docx_zip.read('word/document.xml')
+
+
+def test_parallel_conversion_matches_serial(multipage_pdf, tmp_path):
+    serial, serial_xml = _convert(multipage_pdf, tmp_path / "serial.docx", workers=1)
+    for workers in (2, 3):
+        parallel, parallel_xml = _convert(multipage_pdf, tmp_path / f"parallel{workers}.docx", workers=workers)
+        assert parallel_xml == serial_xml
+        assert parallel['stats'] == serial['stats']
+    assert serial['pages_converted'] == 6
+    assert serial_xml.count(b'<wp:docPr ') == 7
+
+
+def _fix_text_spacing_five_pass(text):
+    """The substitutions _fix_text_spacing used to run one after another"""
+    text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
+    text = re.sub(r'([.!?])([A-Z])', r'\1 \2', text)
+    text = re.sub(r'([a-z])(of|and|the|in|on|at|by|for|with|to)([A-Z])', r'\1 \2 \3', text)
+    text = re.sub(r'([a-z])(\d)', r'\1 \2', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text
+
+
+@pytest.mark.parametrize('text', [
+    'THE FIRST HUNDRED YEARS',
+    'Plain body text in Times and italic tail',
+    'Second line of Avon Park with 33825 numbers.',
+    'wordofThe pageOne.Next!Then?Last',
+    'camelCaseWordsand digits42 andmore7',
+    'tabs\there  and\n\nnewlines \u00a0nbsp',
+    'already lowercase with single spaces',
+    'lowercase  with double spaces',
+    'ends with a space ',
+    'ÉcoleÀ émigréZone',
+    '',
+])
+def test_fix_text_spacing_matches_the_five_passes(text):
+    converter = ModernPDF2DOCXConverter()
+    assert converter._fix_text_spacing(text) == _fix_text_spacing_five_pass(text)
+
+
+def test_fix_text_spacing_matches_the_five_passes_on_the_sample(sample_pdf):
+    converter = ModernPDF2DOCXConverter()
+    with fitz.open(sample_pdf) as doc:
+        for page in doc:
+            for block in page.get_text('dict')['blocks']:
+                for line in block.get('lines', ()):
+                    for span in line['spans']:
+                        assert converter._fix_text_spacing(span['text']) == _fix_text_spacing_five_pass(span['text'])
+
+
+def _group_by_line_ids(text_blocks):
+    """The grouping as it was before the vectorized fast path"""
+    ys = np.array([block['y'] for block in text_blocks], dtype=np.float64)
+    xs = np.array([block['x'] for block in text_blocks], dtype=np.float64)
+    line_ids = _assign_line_ids(ys, np.argsort(ys, kind='stable'), 5)
+
+    paragraphs = []
+    current_line = -1
+    for idx in np.lexsort((xs, line_ids)):
+        if line_ids[idx] != current_line:
+            current_line = line_ids[idx]
+            paragraphs.append(ParagraphData(text_parts=[], y_position=ys[idx]))
+        paragraphs[-1].text_parts.append(text_blocks[idx])
+    return paragraphs
+
+
+def _line_layouts(sample_pdf):
+    """The sample's own blocks plus random layouts, some with drifting baselines"""
+    converter = ModernPDF2DOCXConverter()
+    yield next(iter(converter.extract_pdf_content(sample_pdf)['pages'])).text_blocks
+
+    rng = np.random.default_rng(0)
+    for drift in (0.0, 2.0, 4.0):
+        for _ in range(50):
+            count = int(rng.integers(1, 40))
+            line_ys = np.repeat(rng.uniform(0, 800, size=count // 3 + 1), 3)[:count]
+            ys = line_ys + rng.uniform(0, drift, size=count)
+            xs = rng.uniform(0, 500, size=count)
+            yield [{'text': str(i), 'x': float(x), 'y': float(y)} for i, (x, y) in enumerate(zip(xs, ys))]
+
+
+def test_line_grouping_fast_path_matches_fallback(sample_pdf):
+    converter = ModernPDF2DOCXConverter()
+    for text_blocks in _line_layouts(sample_pdf):
+        fast = converter._group_text_into_paragraphs(text_blocks)
+        reference = _group_by_line_ids(text_blocks)
+        assert [[id(part) for part in p.text_parts] for p in fast] == \
+            [[id(part) for part in p.text_parts] for p in reference]
+        assert [p.y_position for p in fast] == [p.y_position for p in reference]
+
+
+def test_compressed_images_are_stored_without_deflate(multipage_pdf, tmp_path):
+    output_path = tmp_path / "out.docx"
+    _convert(multipage_pdf, output_path, workers=1)
+
+    with zipfile.ZipFile(output_path) as docx_zip:
+        compress_types = {info.filename: info.compress_type for info in docx_zip.infolist()}
+        assert docx_zip.testzip() is None
+    media = [name for name in compress_types if name.startswith('word/media/')]
+    assert media and all(name.endswith('.png') for name in media)
+    assert all(compress_types[name] == zipfile.ZIP_STORED for name in media)
+    assert compress_types['word/document.xml'] == zipfile.ZIP_DEFLATED
+    assert compress_types['[Content_Types].xml'] == zipfile.ZIP_DEFLATED
+
+
+def test_plain_mode_writes_one_default_paragraph_per_block(sample_pdf, tmp_path, monkeypatch):
+    output_path = tmp_path / "plain.docx"
+    monkeypatch.setattr(sys, 'argv', ['modern_pdf2docx_converter', sample_pdf, str(output_path), '--plain'])
+    main()
+
+    with fitz.open(sample_pdf) as doc:
+        expected = [
+            ' '.join(block[4].split())
+            for page in doc
+            for block in page.get_text("blocks", flags=TEXT_EXTRACTION_FLAGS)
+            if block[6] == 0 and block[4].strip()
+        ]
+    paragraphs = [p for p in Document(str(output_path)).paragraphs if p.text]
+    assert [p.text for p in paragraphs] == expected
+    for paragraph in paragraphs:
+        assert len(paragraph.runs) == 1
+        font = paragraph.runs[0].font
+        assert (font.name, font.size.pt, font.bold, font.italic) == ('Calibri', 12, None, None)
+
+
+def test_repeated_images_share_one_part_and_shapes_get_unique_ids(multipage_pdf, tmp_path):
+    output_path = tmp_path / "out.docx"
+    _, document_xml = _convert(multipage_pdf, output_path, workers=1)
+
+    with zipfile.ZipFile(output_path) as docx_zip:
+        media = [name for name in docx_zip.namelist() if name.startswith('word/media/')]
+    # Seven placements of two distinct images; the repeated logo is stored once
+    assert len(Document(str(output_path)).inline_shapes) == 7
+    assert len(media) == 2
+
+    shape_ids = re.findall(rb'<wp:docPr id="(\d+)"', document_xml)
+    assert len(shape_ids) == 7
+    assert len(set(shape_ids)) == len(shape_ids)
+
+
+@pytest.fixture
+def template_docx(tmp_path):
+    """A template with its own margins, a paragraph and a table"""
+    template = Document()
+    section = template.sections[0]
+    section.left_margin = section.right_margin = Inches(1.5)
+    template.add_paragraph('Template boilerplate')
+    template.add_table(rows=1, cols=2).cell(0, 0).text = 'Kept cell'
+    path = tmp_path / "template.docx"
+    template.save(str(path))
+    return str(path)
+
+
+def test_template_is_parsed_once(multipage_pdf, template_docx, tmp_path, monkeypatch):
+    opened = []
+    document_factory = converter_module.Document
+
+    def recording_document(*args):
+        opened.append(args)
+        return document_factory(*args)
+
+    monkeypatch.setattr(converter_module, 'Document', recording_document)
+    output_path = tmp_path / "out.docx"
+    _convert(multipage_pdf, output_path, template_path=template_docx, workers=1)
+
+    assert opened == [(template_docx,)]
+    section = Document(str(output_path)).sections[0]
+    assert section.left_margin == section.right_margin == Inches(1.5)
+
+
+def test_template_paragraphs_are_cleared_but_tables_and_section_kept(multipage_pdf, template_docx, tmp_path):
+    output_path = tmp_path / "out.docx"
+    _convert(multipage_pdf, output_path, template_path=template_docx, workers=1)
+    plain_path = tmp_path / "plain.docx"
+    _convert(multipage_pdf, plain_path, workers=1)
+
+    document = Document(str(output_path))
+    # Only the converted paragraphs remain
+    assert [p.text for p in document.paragraphs] == [p.text for p in Document(str(plain_path)).paragraphs]
+    assert [table.cell(0, 0).text for table in document.tables] == ['Kept cell']
+    body = document.element.body
+    assert body[-1].tag == converter_module.qn('w:sectPr')
+    assert len(body.findall(converter_module.qn('w:sectPr'))) == 1
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for core.pdf_extraction.PDFExtractor
+"""
+
+from concurrent.futures import Future
+
+import pytest
+
+import converters.modern_pdf2docx_converter as converter_module
+from core.pdf_extraction import PDFExtractor
+
+
+def test_context_manager_keeps_pdf_open(multipage_pdf):
+    with PDFExtractor(multipage_pdf) as extractor:
+        document = extractor.pdf_document
+        first = extractor.extract_content()
+        second = extractor.extract_content(multipage_pdf, num_workers=2)
+        assert extractor.pdf_document is document
+        assert not document.is_closed
+
+    assert document.is_closed
+    assert extractor.pdf_document is None
+    assert first == second
+    assert first['total_pages'] == 6
+
+
+def test_missing_pdf_path_is_rejected():
+    with pytest.raises(ValueError):
+        PDFExtractor().extract_content()
+    with pytest.raises(ValueError):
+        next(PDFExtractor().iter_pages())
+    with pytest.raises(ValueError):
+        with PDFExtractor():
+            pass
+
+
+def test_other_pdf_inside_with_block_is_rejected(multipage_pdf, sample_pdf):
+    with PDFExtractor(multipage_pdf) as extractor:
+        with pytest.raises(ValueError):
+            extractor.extract_content(sample_pdf)
+
+
+def test_parallel_extraction_matches_serial(multipage_pdf):
+    serial = PDFExtractor(multipage_pdf)
+    parallel = PDFExtractor(multipage_pdf)
+
+    assert parallel.extract_content(num_workers=2) == serial.extract_content(num_workers=1)
+    # Worker stats are recounted from the returned pages
+    assert parallel.conversion_stats == serial.conversion_stats
+    assert serial.conversion_stats['images_extracted'] == 7
+
+
+class _InlinePool:
+    """Stands in for the extraction pool: runs each task on submit and
+    counts how many were handed out"""
+
+    def __init__(self):
+        self.submitted = 0
+
+    def submit(self, fn, *args):
+        self.submitted += 1
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+def test_iter_pages_extracts_a_bounded_window(multipage_pdf, monkeypatch):
+    pool = _InlinePool()
+    monkeypatch.setattr(converter_module, 'get_extract_pool', lambda workers: pool)
+    monkeypatch.setattr(converter_module, 'PAGES_PER_TASK', 1)
+
+    pages = PDFExtractor(multipage_pdf).iter_pages(num_workers=2)
+    for taken, page in enumerate(pages, start=1):
+        # One page per run: never more than 2 * workers runs ahead
+        assert pool.submitted <= taken + 4
+        assert page['page_number'] == taken - 1
+    assert pool.submitted == 6
+
+
+def test_iter_pages_is_lazy(multipage_pdf):
+    extractor = PDFExtractor(multipage_pdf)
+    pages = extractor.iter_pages(num_workers=1)
+    assert extractor.conversion_stats['pages_processed'] == 0
+
+    next(pages)
+    assert extractor.conversion_stats['pages_processed'] == 1
+
+    # Abandoning the iterator closes the PDF it opened
+    pages.close()
+    assert extractor.pdf_document is None
@@ -6,9 +6,14 @@ Tests multiple PDF text extraction methods to find the best approach
 for proper text extraction without word scrambling.
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from io import BytesIO, StringIO
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
 import logging
 
 # Multiple PDF libraries for comparison
@@ -31,7 +36,7 @@ except ImportError:
     PDFPLUMBER_AVAILABLE = False
 
 try:
-    from pdfminer.high_level import extract_text
+    from pdfminer.high_level import extract_text, extract_text_to_fp
     from pdfminer.layout import LAParams
     PDFMINER_AVAILABLE = True
 except ImportError:
@@ -40,33 +45,56 @@ except ImportError:
 logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
 logger = logging.getLogger(__name__)
 
+def _build_method_registry() -> Tuple[Tuple[str, str], ...]:
+    """List the (method name, extractor attribute) pairs usable here"""
+    methods = []
+    if PYPDF_AVAILABLE:
+        methods.append(('pypdf_simple', '_extract_pypdf_simple'))
+        methods.append(('pypdf_visitor', '_extract_pypdf_visitor'))
+    
+    if PYMUPDF_AVAILABLE:
+        methods.append(('pymupdf_simple', '_extract_pymupdf_simple'))
+        methods.append(('pymupdf_dict', '_extract_pymupdf_dict'))
+        methods.append(('pymupdf_blocks', '_extract_pymupdf_blocks'))
+    
+    if PDFPLUMBER_AVAILABLE:
+        methods.append(('pdfplumber', '_extract_pdfplumber'))
+    
+    if PDFMINER_AVAILABLE:
+        methods.append(('pdfminer', '_extract_pdfminer'))
+    
+    return tuple(methods)
+
+# Library availability is fixed at import time, so the registry is built once
+_AVAILABLE_METHODS = _build_method_registry()
+
+# A result with at least this many words and no sign of missing spaces (or,
+# given reference text, at least this similarity to it) ends an early-exit
+# search without trying the slower methods. Words run together by missing
+# spaces show up as a long average word length.
+GOOD_ENOUGH_MIN_WORDS = 50
+GOOD_ENOUGH_MAX_MEAN_WORD_LENGTH = 10
+GOOD_ENOUGH_SIMILARITY = 0.9
+
+# Order in which the early-exit search tries methods, fastest first
+_SPEED_RANK = {
+    method_name: rank for rank, method_name in enumerate((
+        'pymupdf_blocks', 'pymupdf_simple', 'pymupdf_dict',
+        'pypdf_simple', 'pypdf_visitor', 'pdfplumber', 'pdfminer'
+    ))
+}
+
 class EnhancedTextExtractor:
     """Test multiple text extraction methods to find the best approach"""
     
     def __init__(self):
-        self.extraction_methods = []
-        self._register_available_methods()
-    
-    def _register_available_methods(self):
-        """Register all available extraction methods"""
-        if PYPDF_AVAILABLE:
-            self.extraction_methods.append(('pypdf_simple', self._extract_pypdf_simple))
-            self.extraction_methods.append(('pypdf_visitor', self._extract_pypdf_visitor))
-        
-        if PYMUPDF_AVAILABLE:
-            self.extraction_methods.append(('pymupdf_simple', self._extract_pymupdf_simple))
-            self.extraction_methods.append(('pymupdf_dict', self._extract_pymupdf_dict))
-            self.extraction_methods.append(('pymupdf_blocks', self._extract_pymupdf_blocks))
-        
-        if PDFPLUMBER_AVAILABLE:
-            self.extraction_methods.append(('pdfplumber', self._extract_pdfplumber))
-        
-        if PDFMINER_AVAILABLE:
-            self.extraction_methods.append(('pdfminer', self._extract_pdfminer))
-        
+        self.extraction_methods = tuple(
+            (method_name, getattr(self, attr_name))
+            for method_name, attr_name in _AVAILABLE_METHODS
+        )
         logger.info(f"Registered {len(self.extraction_methods)} extraction methods")
     
-    def _extract_pypdf_simple(self, pdf_path: str) -> Dict:
+    def _extract_pypdf_simple(self, pdf_path: Union[str, BinaryIO]) -> Dict:
         """Extract text using pypdf simple method"""
         try:
             reader = PdfReader(pdf_path)
@@ -89,7 +117,7 @@ class EnhancedTextExtractor:
         except Exception as e:
             return {'status': 'error', 'error': str(e)}
     
-    def _extract_pypdf_visitor(self, pdf_path: str) -> Dict:
+    def _extract_pypdf_visitor(self, pdf_path: Union[str, BinaryIO]) -> Dict:
         """Extract text using pypdf visitor method with layout preservation"""
         try:
             reader = PdfReader(pdf_path)
@@ -143,10 +171,10 @@ class EnhancedTextExtractor:
         except Exception as e:
             return {'status': 'error', 'error': str(e)}
     
-    def _extract_pymupdf_simple(self, pdf_path: str) -> Dict:
+    def _extract_pymupdf_simple(self, pdf_path: Union[str, 'fitz.Document']) -> Dict:
         """Extract text using PyMuPDF simple method"""
         try:
-            doc = fitz.open(pdf_path)
+            doc, owns_doc = self._open_pymupdf(pdf_path)
             text_blocks = []
             
             for page_num in range(len(doc)):
@@ -159,7 +187,8 @@ class EnhancedTextExtractor:
                         'method': 'pymupdf_simple'
                     })
             
-            doc.close()
+            if owns_doc:
+                doc.close()
             return {
                 'status': 'success',
                 'text_blocks': text_blocks,
@@ -168,10 +197,10 @@ class EnhancedTextExtractor:
         except Exception as e:
             return {'status': 'error', 'error': str(e)}
     
-    def _extract_pymupdf_dict(self, pdf_path: str) -> Dict:
+    def _extract_pymupdf_dict(self, pdf_path: Union[str, 'fitz.Document']) -> Dict:
         """Extract text using PyMuPDF dict method with layout info"""
         try:
-            doc = fitz.open(pdf_path)
+            doc, owns_doc = self._open_pymupdf(pdf_path)
             text_blocks = []
             
             for page_num in range(len(doc)):
@@ -182,10 +211,9 @@ class EnhancedTextExtractor:
                 for block in text_dict["blocks"]:
                     if "lines" in block:  # Text block
                         for line in block["lines"]:
-                            line_text = ""
-                            for span in line["spans"]:
-                                if span["text"].strip():
-                                    line_text += span["text"]
+                            line_text = ''.join(
+                                span["text"] for span in line["spans"] if span["text"].strip()
+                            )
                             
                             if line_text.strip():
                                 bbox = line["bbox"]
@@ -197,7 +225,7 @@ class EnhancedTextExtractor:
                                 })
                 
                 # Sort by position
-                page_text_parts.sort(key=lambda p: (-p['y'], p['x']))
+                page_text_parts = self._sort_parts_by_position(page_text_parts)
                 page_text = ' '.join([part['text'] for part in page_text_parts])
                 
                 if page_text.strip():
@@ -208,7 +236,8 @@ class EnhancedTextExtractor:
                         'parts': page_text_parts
                     })
             
-            doc.close()
+            if owns_doc:
+                doc.close()
             return {
                 'status': 'success',
                 'text_blocks': text_blocks,
@@ -217,10 +246,10 @@ class EnhancedTextExtractor:
         except Exception as e:
             return {'status': 'error', 'error': str(e)}
     
-    def _extract_pymupdf_blocks(self, pdf_path: str) -> Dict:
+    def _extract_pymupdf_blocks(self, pdf_path: Union[str, 'fitz.Document']) -> Dict:
         """Extract text using PyMuPDF blocks method"""
         try:
-            doc = fitz.open(pdf_path)
+            doc, owns_doc = self._open_pymupdf(pdf_path)
             text_blocks = []
             
             for page_num in range(len(doc)):
@@ -240,7 +269,7 @@ class EnhancedTextExtractor:
                         })
                 
                 # Sort by position
-                page_text_parts.sort(key=lambda p: (-p['y'], p['x']))
+                page_text_parts = self._sort_parts_by_position(page_text_parts)
                 page_text = ' '.join([part['text'] for part in page_text_parts])
                 
                 if page_text.strip():
@@ -251,7 +280,8 @@ class EnhancedTextExtractor:
                         'parts': page_text_parts
                     })
             
-            doc.close()
+            if owns_doc:
+                doc.close()
             return {
                 'status': 'success',
                 'text_blocks': text_blocks,
@@ -260,7 +290,73 @@ class EnhancedTextExtractor:
         except Exception as e:
             return {'status': 'error', 'error': str(e)}
     
-    def _extract_pdfplumber(self, pdf_path: str) -> Dict:
+    @staticmethod
+    def _sort_parts_by_position(parts: List[Dict]) -> List[Dict]:
+        """Order parts by descending y, then ascending x
+
+        Same order as sorting on ``(-y, x)``, but done as one NumPy lexsort
+        instead of a Python key call per part.
+        """
+        if len(parts) < 2:
+            return parts
+        import numpy as np  # Only the PyMuPDF dict/blocks methods need it
+        xs = np.fromiter((part['x'] for part in parts), dtype=float, count=len(parts))
+        ys = np.fromiter((part['y'] for part in parts), dtype=float, count=len(parts))
+        return [parts[i] for i in np.lexsort((xs, -ys))]
+    
+    @staticmethod
+    def _open_pymupdf(pdf_path: Union[str, 'fitz.Document']) -> Tuple['fitz.Document', bool]:
+        """Open ``pdf_path`` unless it is already an open document
+
+        Returns the document and whether the caller owns (and must close) it.
+        """
+        if isinstance(pdf_path, fitz.Document):
+            return pdf_path, False
+        return fitz.open(pdf_path), True
+    
+    @staticmethod
+    @contextmanager
+    def _shared_pdf_source(pdf_path: str):
+        """Read the PDF once for every extraction method run in this process
+        
+        Yields ``(data, doc)``: the file's bytes and, when PyMuPDF is
+        available, a document opened from them. Either is None if it could
+        not be produced; the methods then open the path themselves and
+        report their own errors.
+        """
+        data = doc = None
+        try:
+            with open(pdf_path, 'rb') as f:
+                data = f.read()
+            if PYMUPDF_AVAILABLE:
+                doc = fitz.open(stream=data, filetype='pdf')
+        except Exception:
+            doc = None
+        try:
+            yield data, doc
+        finally:
+            if doc is not None:
+                doc.close()
+    
+    @staticmethod
+    def _method_source(method_name: str, pdf_path: str,
+                       shared: Tuple[Optional[bytes], Optional['fitz.Document']]
+                       ) -> Union[str, BinaryIO, 'fitz.Document']:
+        """Pick what to hand an extraction method: the shared document, the bytes or the path"""
+        data, doc = shared
+        if method_name.startswith('pymupdf_'):
+            return doc if doc is not None else pdf_path
+        # pypdf, pdfplumber and pdfminer all read from a file object
+        return BytesIO(data) if data is not None else pdf_path
+    
+    @staticmethod
+    def _method_options(method_name: str, pdfminer_layout: bool = True) -> Dict:
+        """Keyword arguments for one extraction method beyond its source"""
+        if method_name == 'pdfminer':
+            return {'layout': pdfminer_layout}
+        return {}
+    
+    def _extract_pdfplumber(self, pdf_path: Union[str, BinaryIO]) -> Dict:
         """Extract text using pdfplumber"""
         try:
             text_blocks = []
@@ -283,19 +379,34 @@ class EnhancedTextExtractor:
         except Exception as e:
             return {'status': 'error', 'error': str(e)}
     
-    def _extract_pdfminer(self, pdf_path: str) -> Dict:
-        """Extract text using pdfminer"""
+    def _extract_pdfminer(self, pdf_path: Union[str, BinaryIO], layout: bool = True) -> Dict:
+        """Extract text using pdfminer
+        
+        ``layout=False`` skips pdfminer's layout analysis, by far its most
+        expensive step, and returns the text in content-stream order.
+        """
         try:
-            # Try with different layout parameters
-            laparams = LAParams(
-                line_margin=0.5,
-                word_margin=0.1,
-                char_margin=2.0,
-                boxes_flow=0.5,
-                all_texts=False
-            )
-            
-            text = extract_text(pdf_path, laparams=laparams)
+            if layout:
+                # Try with different layout parameters
+                laparams = LAParams(
+                    line_margin=0.5,
+                    word_margin=0.1,
+                    char_margin=2.0,
+                    boxes_flow=0.5,
+                    all_texts=False
+                )
+                
+                text = extract_text(pdf_path, laparams=laparams)
+            else:
+                # extract_text swaps laparams=None for the defaults; the
+                # lower-level call passes None through and skips analysis
+                output = StringIO()
+                if isinstance(pdf_path, str):
+                    with open(pdf_path, 'rb') as f:
+                        extract_text_to_fp(f, output, laparams=None)
+                else:
+                    extract_text_to_fp(pdf_path, output, laparams=None)
+                text = output.getvalue()
             
             if text and text.strip():
                 text_blocks = [{
@@ -314,82 +425,194 @@ class EnhancedTextExtractor:
         except Exception as e:
             return {'status': 'error', 'error': str(e)}
     
-    def compare_extraction_methods(self, pdf_path: str) -> Dict:
-        """Compare all available extraction methods"""
+    def compare_extraction_methods(self, pdf_path: str, max_workers: int = None,
+                                   pdfminer_layout: bool = True) -> Dict:
+        """Compare all available extraction methods
+        
+        The methods are independent, so they run side by side in up to
+        ``max_workers`` processes (default: one per method, capped at the
+        CPU count); ``max_workers=1`` runs them one after another.
+        ``pdfminer_layout=False`` runs pdfminer without layout analysis.
+        """
         logger.info(f"Testing {len(self.extraction_methods)} extraction methods on {pdf_path}")
         
-        results = {}
+        if max_workers is None:
+            max_workers = min(len(self.extraction_methods), os.cpu_count() or 1)
         
-        for method_name, method_func in self.extraction_methods:
-            logger.info(f"Testing {method_name}...")
-            try:
-                result = method_func(pdf_path)
-                results[method_name] = result
+        if max_workers <= 1:
+            with self._shared_pdf_source(pdf_path) as shared:
+                return {
+                    method_name: self._run_extraction_method(
+                        method_name,
+                        partial(
+                            method_func,
+                            self._method_source(method_name, pdf_path, shared),
+                            **self._method_options(method_name, pdfminer_layout)
+                        )
+                    )
+                    for method_name, method_func in self.extraction_methods
+                }
+        
+        # Open documents cannot cross process boundaries, so workers get the path
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (method_name, executor.submit(
+                    method_func, pdf_path, **self._method_options(method_name, pdfminer_layout)
+                ))
+                for method_name, method_func in self.extraction_methods
+            ]
+            # Collect in registration order so results and ties stay deterministic
+            return {
+                method_name: self._run_extraction_method(method_name, future.result)
+                for method_name, future in futures
+            }
+    
+    def _run_extraction_method(self, method_name: str, get_result) -> Dict:
+        """Get one extraction method's result, logging and capturing its outcome"""
+        logger.info(f"Testing {method_name}...")
+        try:
+            result = get_result()
+            
+            if result['status'] == 'success':
+                text_length = len(result['total_text'])
+                word_count = len(result['total_text'].split())
+                logger.info(f"  ✅ {method_name}: {text_length} chars, {word_count} words")
+            else:
+                logger.warning(f"  ❌ {method_name}: {result['error']}")
+            
+            return result
                 
-                if result['status'] == 'success':
-                    text_length = len(result['total_text'])
-                    word_count = len(result['total_text'].split())
-                    logger.info(f"  ✅ {method_name}: {text_length} chars, {word_count} words")
-                else:
-                    logger.warning(f"  ❌ {method_name}: {result['error']}")
-                    
-            except Exception as e:
-                logger.error(f"  💥 {method_name}: {str(e)}")
-                results[method_name] = {'status': 'error', 'error': str(e)}
+        except Exception as e:
+            logger.error(f"  💥 {method_name}: {str(e)}")
+            return {'status': 'error', 'error': str(e)}
+    
+    def _score_result(self, result: Dict, ref_words: frozenset = None) -> float:
+        """Score an extraction result; higher is better
+        
+        ``ref_words`` is the lowercased word set of the reference text.
+        """
+        if result['status'] != 'success':
+            return 0
         
-        return results
+        text = result['total_text']
+        if not text:
+            # Nothing extracted (e.g. a scanned PDF): every criterion scores 0
+            return 0
+        
+        score = 0
+        word_count = len(text.split())
+        
+        # Basic scoring criteria
+        score += len(text)  # Longer text usually better
+        score += word_count * 10  # Word count is important
+        
+        # Penalize obvious issues
+        if 'THEFIRST' in text:  # Missing spaces
+            score -= 100
+        if text.count(' ') < word_count - 1:  # Not enough spaces
+            score -= 50
+        
+        # Bonus for proper formatting
+        if 'THE FIRST' in text:  # Proper spacing
+            score += 200
+        if 'AVON PARK' in text:  # Proper place names
+            score += 100
+        
+        # If we have reference text, compare similarity
+        if ref_words:
+            score += self._similarity(text, ref_words) * 1000
+        
+        return score
     
-    def find_best_extraction_method(self, pdf_path: str, reference_text: str = None) -> Tuple[str, Dict]:
-        """Find the best extraction method based on various criteria"""
-        results = self.compare_extraction_methods(pdf_path)
+    @staticmethod
+    def _similarity(text: str, ref_words: frozenset) -> float:
+        """Simple similarity check (Jaccard index of the word sets)"""
+        text_words = set(text.lower().split())
+        common = len(ref_words & text_words)
+        return common / (len(ref_words) + len(text_words) - common)
+    
+    def _is_good_enough(self, result: Dict, ref_words: frozenset = None) -> bool:
+        """Whether a result is good enough to stop trying other methods
         
-        # Score each method
-        method_scores = {}
+        With reference text the similarity decides; otherwise the text
+        needs GOOD_ENOUGH_MIN_WORDS words with a plausible average length
+        and no 'THEFIRST' marker.
+        """
+        if result['status'] != 'success' or not result['total_text']:
+            return False
         
-        for method_name, result in results.items():
-            if result['status'] != 'success':
-                method_scores[method_name] = 0
-                continue
-            
-            score = 0
-            text = result['total_text']
-            
-            # Basic scoring criteria
-            score += len(text)  # Longer text usually better
-            score += len(text.split()) * 10  # Word count is important
-            
-            # Penalize obvious issues
-            if 'THEFIRST' in text:  # Missing spaces
-                score -= 100
-            if text.count(' ') < len(text.split()) - 1:  # Not enough spaces
-                score -= 50
-            
-            # Bonus for proper formatting
-            if 'THE FIRST' in text:  # Proper spacing
-                score += 200
-            if 'AVON PARK' in text:  # Proper place names
-                score += 100
-            
-            # If we have reference text, compare similarity
-            if reference_text:
-                # Simple similarity check
-                ref_words = set(reference_text.lower().split())
-                text_words = set(text.lower().split())
-                similarity = len(ref_words & text_words) / len(ref_words | text_words)
-                score += similarity * 1000
-            
-            method_scores[method_name] = score
+        text = result['total_text']
+        if ref_words:
+            return self._similarity(text, ref_words) >= GOOD_ENOUGH_SIMILARITY
+        
+        words = text.split()
+        return (len(words) >= GOOD_ENOUGH_MIN_WORDS
+                and 'THEFIRST' not in text
+                and sum(map(len, words)) <= GOOD_ENOUGH_MAX_MEAN_WORD_LENGTH * len(words))
+    
+    def find_best_extraction_method(self, pdf_path: str, reference_text: str = None,
+                                    early_exit: bool = False,
+                                    pdfminer_layout: bool = False) -> Tuple[str, Dict]:
+        """Find the best extraction method based on various criteria
+        
+        With ``early_exit``, methods run one at a time (fastest first) and
+        the search stops at the first good-enough result (see
+        _is_good_enough), instead of running every extractor.
+        
+        pdfminer is scored without layout analysis unless ``pdfminer_layout``
+        is set; if it wins, it is run again with layout analysis so the
+        returned text is its usual output.
+        """
+        # The reference word set is the same for every method
+        ref_words = frozenset(reference_text.lower().split()) if reference_text else None
+        
+        # Score each method
+        if not early_exit:
+            results = self.compare_extraction_methods(pdf_path, pdfminer_layout=pdfminer_layout)
+            method_scores = {
+                method_name: self._score_result(result, ref_words)
+                for method_name, result in results.items()
+            }
+        else:
+            results = {}
+            method_scores = {}
+            with self._shared_pdf_source(pdf_path) as shared:
+                for method_name, method_func in sorted(
+                    self.extraction_methods, key=lambda method: _SPEED_RANK[method[0]]
+                ):
+                    results[method_name] = self._run_extraction_method(
+                        method_name,
+                        partial(
+                            method_func,
+                            self._method_source(method_name, pdf_path, shared),
+                            **self._method_options(method_name, pdfminer_layout)
+                        )
+                    )
+                    method_scores[method_name] = self._score_result(results[method_name], ref_words)
+                    if self._is_good_enough(results[method_name], ref_words):
+                        logger.info(f"{method_name} is good enough, skipping remaining methods")
+                        break
         
         # Find best method
         if method_scores:
             best_method = max(method_scores.items(), key=lambda x: x[1])
+            if best_method[0] == 'pdfminer' and not pdfminer_layout:
+                return 'pdfminer', self._run_extraction_method(
+                    'pdfminer', partial(self._extract_pdfminer, pdf_path)
+                )
             return best_method[0], results[best_method[0]]
         else:
             return None, None
     
-    def extract_with_best_method(self, pdf_path: str) -> Dict:
-        """Extract text using the best available method"""
-        best_method_name, best_result = self.find_best_extraction_method(pdf_path)
+    def extract_with_best_method(self, pdf_path: str, early_exit: bool = True) -> Dict:
+        """Extract text using the best available method
+        
+        By default the search stops at the first good-enough method;
+        ``early_exit=False`` scores every method.
+        """
+        best_method_name, best_result = self.find_best_extraction_method(
+            pdf_path, early_exit=early_exit
+        )
         
         if best_method_name:
             logger.info(f"Best extraction method: {best_method_name}")
@@ -416,6 +639,10 @@ def main():
     parser.add_argument('--best', action='store_true', help='Find and use best extraction method')
     parser.add_argument('--method', help='Use specific extraction method')
     parser.add_argument('--output', help='Save extracted text to file')
+    parser.add_argument('--all-methods', action='store_true',
+                        help='With --best, score every method instead of stopping at the first good one')
+    parser.add_argument('--pdfminer-no-layout', action='store_true',
+                        help='Run pdfminer without layout analysis when comparing methods')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     
     args = parser.parse_args()
@@ -429,7 +656,9 @@ def main():
         print(f"\n🔍 Comparing all extraction methods for: {args.pdf_path}")
         print("=" * 60)
         
-        results = extractor.compare_extraction_methods(args.pdf_path)
+        results = extractor.compare_extraction_methods(
+            args.pdf_path, pdfminer_layout=not args.pdfminer_no_layout
+        )
         
         for method_name, result in results.items():
             print(f"\n📋 Method: {method_name}")
@@ -446,7 +675,7 @@ def main():
         print(f"\n🎯 Finding best extraction method for: {args.pdf_path}")
         print("=" * 60)
         
-        result = extractor.extract_with_best_method(args.pdf_path)
+        result = extractor.extract_with_best_method(args.pdf_path, early_exit=not args.all_methods)
         
         if result['best_method']:
             print(f"✅ Best method: {result['best_method']}")
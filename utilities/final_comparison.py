@@ -12,11 +12,9 @@ def read_docx_text(docx_path):
     try:
         from docx import Document
         doc = Document(docx_path)
-        text = []
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                text.append(paragraph.text.strip())
-        return '\n'.join(text)
+        # paragraph.text walks the run XML, so read it once per paragraph
+        texts = (paragraph.text.strip() for paragraph in doc.paragraphs)
+        return '\n'.join(text for text in texts if text)
     except Exception as e:
         return f"Error reading {docx_path}: {e}"
 
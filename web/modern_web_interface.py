@@ -2,7 +2,7 @@
 """
 Modern Web Interface for PDF to DOCX Converter
 
-A Flask web application using the modern pypdf + python-docx converter
+A Flask web application using the modern PyMuPDF + python-docx converter
 with proper text extraction and template support.
 """
 
@@ -355,7 +355,7 @@ if __name__ == '__main__':
         </div>
         <h1>🔄 PDF to DOCX Converter</h1>
         <p class="subtitle">
-            Advanced conversion using <strong>pypdf</strong> + <strong>python-docx</strong><br>
+            Advanced conversion using <strong>PyMuPDF</strong> + <strong>python-docx</strong><br>
             Proper text extraction • Template formatting • No text-to-image conversion
         </p>
         
@@ -462,7 +462,7 @@ if __name__ == '__main__':
                     <tr>
                         <td>Text Extraction</td>
                         <td class="old-method">Often converts text to images</td>
-                        <td class="new-method">Pure text extraction with pypdf</td>
+                        <td class="new-method">Pure text extraction with PyMuPDF</td>
                     </tr>
                     <tr>
                         <td>Template Support</td>
@@ -490,7 +490,7 @@ if __name__ == '__main__':
         f.write(html_template)
     
     print("Starting Modern PDF to DOCX Converter Web Interface...")
-    print("🚀 Modern converter using pypdf + python-docx")
+    print("🚀 Modern converter using PyMuPDF + python-docx")
     print("✅ Proper text extraction (no text-to-image conversion)")
     print("📐 Template formatting support (margins, page size, orientation)")
     print("🔤 Automatic spacing fixes")